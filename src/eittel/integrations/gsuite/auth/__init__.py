@@ -5,6 +5,7 @@ This module provides OAuth credential management for Google Workspace APIs.
 
 Features:
 - Persistent credential storage (file system or Firestore)
+- Async Firestore reads for non-blocking lookups and bulk prefetch
 - In-memory credential caching for performance
 - Automatic token refresh
 - Multi-user support
@@ -23,12 +24,7 @@ Quick Start:
     >>> store.store_credential("user@example.com", credentials)
 """
 
-from .credential_store import (
-    CredentialStore,
-    LocalDirectoryCredentialStore,
-    get_credential_store,
-    set_credential_store,
-)
+import importlib
 
 from .scopes import (
     # Base scopes
@@ -69,10 +65,31 @@ from .scopes import (
     get_scopes_for_tools,
 )
 
-from .session_store import (
-    CredentialCache,
-    get_credential_cache,
-)
+# Credential storage and caching are resolved lazily (PEP 562) so importing
+# scope constants does not load google-auth or the Firestore client.
+_LAZY_ATTRS = {
+    'CredentialStore': '.credential_store',
+    'LocalDirectoryCredentialStore': '.credential_store',
+    'get_credential_store': '.credential_store',
+    'set_credential_store': '.credential_store',
+    'FirestoreCredentialStore': '.firestore_credential_store',
+    'AsyncFirestoreCredentialStore': '.async_firestore_credential_store',
+    'CredentialCache': '.session_store',
+    'get_credential_cache': '.session_store',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     # Credential storage
@@ -80,6 +97,8 @@ __all__ = [
     'LocalDirectoryCredentialStore',
     'get_credential_store',
     'set_credential_store',
+    'FirestoreCredentialStore',
+    'AsyncFirestoreCredentialStore',
 
     # Credential caching
     'CredentialCache',
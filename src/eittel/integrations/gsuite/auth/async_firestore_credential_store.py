@@ -0,0 +1,159 @@
+"""
+Async Firestore-based credential reader for Google Workspace integrations.
+
+This module provides an asyncio-native counterpart to FirestoreCredentialStore
+for reading credentials without blocking the event loop, and for prefetching
+many users' credentials concurrently (e.g. at worker warmup).
+"""
+
+import os
+import asyncio
+import logging
+from typing import Dict, Iterable, Optional
+
+from google.cloud import firestore
+from google.oauth2.credentials import Credentials
+
+from .firestore_credential_store import FirestoreCredentialStore, _format_error
+from .session_store import get_credential_cache
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFirestoreCredentialStore:
+    """
+    Read-side credential store backed by Firestore's AsyncClient.
+
+    Uses the same collection, token field and document layout as
+    FirestoreCredentialStore (see its docstring), so both can be used
+    against the same database. Writes stay on FirestoreCredentialStore.
+
+    Usage:
+        >>> store = AsyncFirestoreCredentialStore()
+        >>> creds = await store.get_credential("user@example.com")
+        >>> await store.prefetch(["a@example.com", "b@example.com"])
+    """
+
+    def __init__(self, firestore_project: Optional[str] = None, firestore_database: Optional[str] = None):
+        """
+        Initialize the async Firestore credential store.
+
+        Args:
+            firestore_project: GCP project ID. If None, reads from FIRESTORE_PROJECT env var.
+            firestore_database: Firestore database name. If None, reads from FIRESTORE_DATABASE
+                              env var or defaults to "(default)".
+
+        Raises:
+            ValueError: If firestore_project is not provided and FIRESTORE_PROJECT env var is not set.
+            RuntimeError: If the Firestore client cannot be created.
+        """
+        self.project = firestore_project or os.getenv("FIRESTORE_PROJECT")
+        if not self.project:
+            raise ValueError(
+                "Firestore project not configured. "
+                "Set FIRESTORE_PROJECT environment variable or pass firestore_project parameter."
+            )
+
+        self.database = firestore_database or os.getenv("FIRESTORE_DATABASE", "(default)")
+        self.collection_name = os.getenv("FIRESTORE_COLLECTION", "technico")
+        self.token_field = os.getenv("FIRESTORE_TOKEN_FIELD", "google_oauth_tokens")
+
+        try:
+            self.db = firestore.AsyncClient(
+                project=self.project,
+                database=self.database,
+            )
+        except Exception as e:
+            error_msg = _format_error(
+                "init", e, project=self.project, database=self.database
+            )
+            logger.error(error_msg, exc_info=True)
+            raise RuntimeError(error_msg) from e
+
+        self._collection = self.db.collection(self.collection_name)
+        self._credential_cache = get_credential_cache()
+
+        logger.info(
+            f"Initialized async Firestore credential store: "
+            f"project={self.project}, database={self.database}, "
+            f"collection={self.collection_name}, token_field={self.token_field}"
+        )
+
+    async def get_credential(self, user_id: str) -> Optional[Credentials]:
+        """
+        Load OAuth credentials from Firestore for a user.
+
+        Args:
+            user_id: User identifier (used as document ID in Firestore)
+
+        Returns:
+            Google Credentials object or None if not found or on error
+        """
+        if not user_id or not user_id.strip():
+            logger.warning("get_credential called with empty user_id")
+            return None
+
+        if self._credential_cache.is_missing(user_id):
+            return None
+
+        try:
+            doc = await self._collection.document(user_id).get(field_paths=[self.token_field])
+
+            token_data = None
+            if doc.exists:
+                try:
+                    token_data = doc.get(self.token_field)
+                except KeyError:
+                    pass
+            if not token_data:
+                logger.debug(f"No {self.token_field} found for user: {user_id}")
+                self._credential_cache.mark_missing(user_id)
+                return None
+
+            if not isinstance(token_data, dict):
+                logger.warning(
+                    f"Invalid token data type for user {user_id}: "
+                    f"expected dict, got {type(token_data).__name__}"
+                )
+                return None
+
+            return FirestoreCredentialStore._token_data_to_credentials(token_data)
+
+        except Exception as e:
+            logger.error(_format_error("get", e, user_id=user_id), exc_info=True)
+            return None
+
+    async def get_credentials_bulk(self, user_ids: Iterable[str]) -> Dict[str, Optional[Credentials]]:
+        """
+        Load credentials for many users concurrently.
+
+        Args:
+            user_ids: User identifiers to load
+
+        Returns:
+            Dictionary mapping each user ID to its Credentials (or None)
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        results = await asyncio.gather(*(self.get_credential(uid) for uid in user_ids))
+        return dict(zip(user_ids, results))
+
+    async def prefetch(self, user_ids: Iterable[str]) -> int:
+        """
+        Warm the in-memory credential cache for many users.
+
+        Args:
+            user_ids: User identifiers to load
+
+        Returns:
+            Number of users whose credentials were cached
+        """
+        credentials_by_user = await self.get_credentials_bulk(user_ids)
+
+        cached = 0
+        for user_id, creds in credentials_by_user.items():
+            if creds is not None:
+                self._credential_cache.set(user_id, creds)
+                cached += 1
+
+        logger.info(f"Prefetched credentials for {cached}/{len(credentials_by_user)} users")
+        return cached
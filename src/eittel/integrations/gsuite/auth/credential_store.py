@@ -13,6 +13,8 @@ from typing import Optional, List
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 
+from .session_store import get_credential_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,6 +167,8 @@ class LocalDirectoryCredentialStore(CredentialStore):
             with open(creds_path, "w") as f:
                 json.dump(creds_data, f, indent=2)
             logger.info(f"Stored credentials for {user_id} to {creds_path}")
+            # The user may have been negative-cached before authorizing
+            get_credential_cache().clear_missing(user_id)
             return True
         except IOError as e:
             logger.error(
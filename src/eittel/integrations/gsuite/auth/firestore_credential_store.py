@@ -6,17 +6,266 @@ cloud-native, multi-tenant credential management.
 """
 
 import os
+import time
+import functools
+import operator
+import queue
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
+from google.cloud.firestore_v1.field_path import FieldPath
 from google.oauth2.credentials import Credentials
 
 from .credential_store import CredentialStore
+from .session_store import get_credential_cache
 
 logger = logging.getLogger(__name__)
 
+# Batched write settings (see FirestoreCredentialStore.store_credential_batched)
+BATCH_FLUSH_INTERVAL_SECONDS = 0.05
+MAX_BATCH_SIZE = 500  # Firestore limit on operations per WriteBatch
+
+# Marks token data written by this store, which can skip type validation on read
+TOKEN_DATA_SCHEMA_VERSION = 1
+
+DEFAULT_TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# Reads every Credentials attribute persisted by _credentials_to_token_data
+_get_credential_fields = operator.attrgetter(
+    "token", "refresh_token", "token_uri", "client_id", "client_secret", "scopes", "expiry"
+)
+
+# Number of per-user DocumentReference objects kept for reuse
+DOC_REF_CACHE_SIZE = 2048
+
+
+# Exception classification per operation: first matching kind wins (checked
+# on str(e).lower()). Each operation keeps its own kinds and precedence, e.g.
+# init checks auth before network/timeout.
+_ERROR_PATTERNS = {
+    "init": (
+        ("permission", ("permission", "forbidden", "403")),
+        ("not_found", ("not found", "404")),
+        ("auth", ("credential", "auth")),
+        ("network", ("network", "connection", "timeout")),
+    ),
+    "get": (
+        ("permission", ("permission", "forbidden")),
+        ("timeout", ("timeout", "deadline")),
+        ("unavailable", ("unavailable",)),
+    ),
+    "store": (
+        ("permission", ("permission", "forbidden")),
+        ("timeout", ("timeout", "deadline")),
+        ("quota", ("quota", "rate limit")),
+    ),
+    "delete": (
+        ("permission", ("permission", "forbidden")),
+        ("not_found", ("not found",)),
+    ),
+}
+
+# Log message templates per operation and error kind ("generic" is the fallback)
+_ERROR_TEMPLATES = {
+    "init": {
+        "permission": (
+            "Failed to initialize Firestore client for project={project}, database={database}: {error}\n"
+            "This appears to be a permissions issue. Please ensure:\n"
+            "  1. The service account has Firestore permissions (roles/datastore.user)\n"
+            "  2. GOOGLE_APPLICATION_CREDENTIALS is set to the correct service account key\n"
+            "  3. The Firestore API is enabled in the GCP project"
+        ),
+        "not_found": (
+            "Failed to initialize Firestore client for project={project}, database={database}: {error}\n"
+            "Project '{project}' or database '{database}' not found. Please verify:\n"
+            "  1. The project ID is correct\n"
+            "  2. The database exists in the project\n"
+            "  3. You have access to the project"
+        ),
+        "auth": (
+            "Failed to initialize Firestore client for project={project}, database={database}: {error}\n"
+            "Authentication failed. Please ensure:\n"
+            "  1. GOOGLE_APPLICATION_CREDENTIALS points to a valid service account key file\n"
+            "  2. The service account has not been deleted or disabled\n"
+            "  3. Application Default Credentials are properly configured"
+        ),
+        "network": (
+            "Failed to initialize Firestore client for project={project}, database={database}: {error}\n"
+            "Network connectivity issue. Please check:\n"
+            "  1. Internet connectivity is available\n"
+            "  2. Firewall rules allow access to firestore.googleapis.com\n"
+            "  3. The service is not experiencing an outage"
+        ),
+        "generic": "Failed to initialize Firestore client for project={project}, database={database}: {error}",
+    },
+    "get": {
+        "permission": (
+            "Permission denied when loading credentials for user {user_id}: {error}. "
+            "Check Firestore IAM permissions."
+        ),
+        "timeout": (
+            "Timeout loading credentials for user {user_id}: {error}. "
+            "Firestore may be experiencing latency issues."
+        ),
+        "unavailable": (
+            "Firestore service unavailable when loading credentials for user {user_id}: {error}. "
+            "This may be a temporary outage."
+        ),
+        "generic": "Error loading credentials from Firestore for user {user_id}: {error}",
+    },
+    "store": {
+        "permission": (
+            "Permission denied when storing credentials for user {user_id}: {error}. "
+            "Check Firestore IAM write permissions."
+        ),
+        "timeout": (
+            "Timeout storing credentials for user {user_id}: {error}. "
+            "Firestore may be experiencing latency issues."
+        ),
+        "quota": (
+            "Quota exceeded when storing credentials for user {user_id}: {error}. "
+            "Check Firestore quota limits."
+        ),
+        "generic": "Error storing credentials to Firestore for user {user_id}: {error}",
+    },
+    "delete": {
+        "permission": (
+            "Permission denied when deleting credentials for user {user_id}: {error}. "
+            "Check Firestore IAM write permissions."
+        ),
+        "generic": "Error deleting credentials from Firestore for user {user_id}: {error}",
+    },
+}
+
+
+def _classify_error(operation: str, error: Exception) -> str:
+    """
+    Classify a Firestore exception by matching its message against the
+    operation's _ERROR_PATTERNS.
+
+    Args:
+        operation: Operation key in _ERROR_PATTERNS ("init", "get", "store", "delete")
+        error: The exception raised by the Firestore client
+
+    Returns:
+        Error kind (e.g. "permission", "timeout"), or "generic" if nothing matches
+    """
+    error_str = str(error).lower()
+    for kind, needles in _ERROR_PATTERNS[operation]:
+        if any(needle in error_str for needle in needles):
+            return kind
+    return "generic"
+
+
+def _format_error(operation: str, error: Exception, **fields) -> str:
+    """
+    Build a context-specific log message for a failed Firestore operation.
+
+    Args:
+        operation: Operation key in _ERROR_TEMPLATES ("init", "get", "store", "delete")
+        error: The exception raised by the Firestore client
+        **fields: Values for the template placeholders (user_id, project, ...)
+
+    Returns:
+        Formatted error message
+    """
+    templates = _ERROR_TEMPLATES[operation]
+    template = templates.get(_classify_error(operation, error), templates["generic"])
+    return template.format(error=error, **fields)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_expiry(expiry_str: str) -> datetime:
+    """
+    Parse an ISO 8601 expiry string into a timezone-naive datetime.
+
+    Results are cached: Google issues hour-aligned tokens, so the same expiry
+    string recurs across users and refreshes.
+
+    Args:
+        expiry_str: ISO 8601 datetime string
+
+    Returns:
+        Timezone-naive datetime (as expected by the Google auth library)
+
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 datetime
+    """
+    expiry = datetime.fromisoformat(expiry_str)
+    if expiry.tzinfo is not None:
+        expiry = expiry.replace(tzinfo=None)
+    return expiry
+
+
+def _decode_expiry(expiry) -> Optional[datetime]:
+    """
+    Convert a stored expiry value into a timezone-naive UTC datetime.
+
+    Expiry is stored as a Firestore Timestamp (returned as an aware datetime);
+    documents written before that store it as an ISO 8601 string.
+
+    Args:
+        expiry: Stored expiry value (datetime, ISO 8601 string, or None)
+
+    Returns:
+        Timezone-naive UTC datetime, or None if no expiry is stored
+
+    Raises:
+        ValueError: If a string value is not a valid ISO 8601 datetime
+    """
+    if not expiry:
+        return None
+    if isinstance(expiry, datetime):
+        if expiry.tzinfo is not None:
+            expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
+        return expiry
+    return _parse_expiry(expiry)
+
+
+# Firestore clients shared across stores, keyed by (project, database), so each
+# database gets one gRPC channel instead of one per store instance
+_CLIENT_POOL: dict[tuple[str, str], firestore.Client] = {}
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+def get_shared_firestore_client(project: str, database: str = "(default)") -> firestore.Client:
+    """
+    Get the process-wide Firestore client for a project and database.
+
+    Args:
+        project: GCP project ID
+        database: Firestore database name
+
+    Returns:
+        Shared firestore.Client instance
+    """
+    key = (project, database)
+    client = _CLIENT_POOL.get(key)
+    if client is None:
+        with _CLIENT_POOL_LOCK:
+            client = _CLIENT_POOL.get(key)
+            if client is None:
+                client = firestore.Client(project=project, database=database)
+                _CLIENT_POOL[key] = client
+    return client
+
+
+class _InflightRead:
+    """A Firestore read in progress, shared by concurrent callers for one user."""
+
+    __slots__ = ("event", "result")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Optional[Credentials] = None
+
 
 class FirestoreCredentialStore(CredentialStore):
     """
@@ -42,7 +291,9 @@ class FirestoreCredentialStore(CredentialStore):
                 "client_id": "client_id",
                 "client_secret": "client_secret",
                 "scopes": ["scope1", "scope2"],
-                "expiry": "2025-01-15T10:30:00"
+                "expiry": Timestamp(2025-01-15T10:30:00Z),
+                "expiry_epoch": 1736937000,
+                "_schema": 1
             }
     """
 
@@ -77,58 +328,37 @@ class FirestoreCredentialStore(CredentialStore):
 
         # Initialize Firestore client
         try:
-            self.db = firestore.Client(
-                project=self.project,
-                database=self.database,
-            )
+            self.db = get_shared_firestore_client(self.project, self.database)
             logger.info(
                 f"Initialized Firestore credential store: "
                 f"project={self.project}, database={self.database}, "
                 f"collection={self.collection_name}, token_field={self.token_field}"
             )
         except Exception as e:
-            # Provide context-specific error messages
-            error_msg = f"Failed to initialize Firestore client for project={self.project}, database={self.database}"
-
-            error_str = str(e).lower()
-            if "permission" in error_str or "forbidden" in error_str or "403" in error_str:
-                error_msg += (
-                    f": {e}\n"
-                    "This appears to be a permissions issue. Please ensure:\n"
-                    "  1. The service account has Firestore permissions (roles/datastore.user)\n"
-                    "  2. GOOGLE_APPLICATION_CREDENTIALS is set to the correct service account key\n"
-                    "  3. The Firestore API is enabled in the GCP project"
-                )
-            elif "not found" in error_str or "404" in error_str:
-                error_msg += (
-                    f": {e}\n"
-                    f"Project '{self.project}' or database '{self.database}' not found. Please verify:\n"
-                    "  1. The project ID is correct\n"
-                    "  2. The database exists in the project\n"
-                    "  3. You have access to the project"
-                )
-            elif "credential" in error_str or "auth" in error_str:
-                error_msg += (
-                    f": {e}\n"
-                    "Authentication failed. Please ensure:\n"
-                    "  1. GOOGLE_APPLICATION_CREDENTIALS points to a valid service account key file\n"
-                    "  2. The service account has not been deleted or disabled\n"
-                    "  3. Application Default Credentials are properly configured"
-                )
-            elif "network" in error_str or "connection" in error_str or "timeout" in error_str:
-                error_msg += (
-                    f": {e}\n"
-                    "Network connectivity issue. Please check:\n"
-                    "  1. Internet connectivity is available\n"
-                    "  2. Firewall rules allow access to firestore.googleapis.com\n"
-                    "  3. The service is not experiencing an outage"
-                )
-            else:
-                error_msg += f": {e}"
-
+            error_msg = _format_error(
+                "init", e, project=self.project, database=self.database
+            )
             logger.error(error_msg, exc_info=True)
             raise RuntimeError(error_msg) from e
 
+        # Reused collection handle and LRU of per-user document references
+        self._collection = self.db.collection(self.collection_name)
+        self._doc_refs: "OrderedDict[str, firestore.DocumentReference]" = OrderedDict()
+        self._doc_refs_lock = threading.Lock()
+
+        # Shared L1 cache: serves warm reads and remembers users with no
+        # stored credentials
+        self._credential_cache = get_credential_cache()
+
+        # In-progress get_credential reads, keyed by user_id
+        self._inflight: dict[str, _InflightRead] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Queue drained by a background thread for batched writes
+        self._write_queue: "queue.Queue[tuple[str, dict, Future]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+
     def get_credential(self, user_id: str) -> Optional[Credentials]:
         """
         Load OAuth credentials from Firestore for a user.
@@ -143,26 +373,69 @@ class FirestoreCredentialStore(CredentialStore):
             logger.warning("get_credential called with empty user_id")
             return None
 
+        # Valid credentials already in L1 skip the Firestore read. Expired ones
+        # are re-read, since another instance may have refreshed them.
+        cached = self._credential_cache.get_valid(user_id)
+        if cached is None:
+            cached = self._credential_cache.get(user_id)
+        if cached is not None and cached.valid:
+            logger.debug(f"Served credentials for user {user_id} from L1 cache")
+            return cached
+
+        # Users recently found to have no credentials skip the Firestore read
+        if self._credential_cache.is_missing(user_id):
+            return None
+
+        # Singleflight: concurrent reads for the same user share one Firestore RPC
+        with self._inflight_lock:
+            inflight = self._inflight.get(user_id)
+            leader = inflight is None
+            if leader:
+                inflight = _InflightRead()
+                self._inflight[user_id] = inflight
+
+        if not leader:
+            inflight.event.wait()
+            logger.debug(f"Reused in-flight Firestore read for user: {user_id}")
+            return inflight.result
+
         try:
-            # Get document reference
-            doc_ref = self.db.collection(self.collection_name).document(user_id)
-            doc = doc_ref.get()
+            inflight.result = self._load_credential(user_id)
+            return inflight.result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(user_id, None)
+            inflight.event.set()
+
+    def _load_credential(self, user_id: str) -> Optional[Credentials]:
+        """
+        Read a user's OAuth credentials from Firestore.
+
+        Args:
+            user_id: User identifier (used as document ID in Firestore)
+
+        Returns:
+            Google Credentials object or None if not found or on error
+        """
+        try:
+            # Get document reference, reading only the token field
+            doc_ref = self._doc(user_id)
+            doc = doc_ref.get(field_paths=[self.token_field])
 
             # Check if document exists
             if not doc.exists:
                 logger.debug(f"No Firestore document found for user: {user_id}")
+                self._credential_cache.mark_missing(user_id)
                 return None
 
-            # Get document data
-            data = doc.to_dict()
-            if not data:
-                logger.debug(f"Firestore document exists but is empty for user: {user_id}")
-                return None
-
-            # Extract token data from configured token field
-            token_data = data.get(self.token_field)
+            # Extract token data from configured token field (no full to_dict())
+            try:
+                token_data = doc.get(self.token_field)
+            except KeyError:
+                token_data = None
             if not token_data:
                 logger.debug(f"No {self.token_field} field found for user: {user_id}")
+                self._credential_cache.mark_missing(user_id)
                 return None
 
             # Validate token data structure
@@ -187,33 +460,7 @@ class FirestoreCredentialStore(CredentialStore):
             return credentials
 
         except Exception as e:
-            error_str = str(e).lower()
-
-            # Provide context-specific error messages for common issues
-            if "permission" in error_str or "forbidden" in error_str:
-                logger.error(
-                    f"Permission denied when loading credentials for user {user_id}: {e}. "
-                    f"Check Firestore IAM permissions.",
-                    exc_info=True,
-                )
-            elif "timeout" in error_str or "deadline" in error_str:
-                logger.error(
-                    f"Timeout loading credentials for user {user_id}: {e}. "
-                    f"Firestore may be experiencing latency issues.",
-                    exc_info=True,
-                )
-            elif "unavailable" in error_str or "service unavailable" in error_str:
-                logger.error(
-                    f"Firestore service unavailable when loading credentials for user {user_id}: {e}. "
-                    f"This may be a temporary outage.",
-                    exc_info=True,
-                )
-            else:
-                logger.error(
-                    f"Error loading credentials from Firestore for user {user_id}: {e}",
-                    exc_info=True,
-                )
-
+            logger.error(_format_error("get", e, user_id=user_id), exc_info=True)
             return None
 
     def store_credential(self, user_id: str, credentials: Credentials) -> bool:
@@ -245,49 +492,146 @@ class FirestoreCredentialStore(CredentialStore):
                 return False
 
             # Get document reference
-            doc_ref = self.db.collection(self.collection_name).document(user_id)
+            doc_ref = self._doc(user_id)
 
             # Store with merge=True to preserve other fields in the document
-            doc_ref.set(
-                {
-                    self.token_field: token_data,
-                    f"{self.token_field}_connected_at": datetime.utcnow().isoformat(),
-                },
-                merge=True,
-            )
+            doc_ref.set(self._build_write_payload(token_data), merge=True)
+            self._credential_cache.clear_missing(user_id)
 
             logger.info(f"Stored OAuth credentials to Firestore for user: {user_id}")
             return True
 
         except Exception as e:
-            error_str = str(e).lower()
+            logger.error(_format_error("store", e, user_id=user_id), exc_info=True)
+            return False
 
-            # Provide context-specific error messages
-            if "permission" in error_str or "forbidden" in error_str:
-                logger.error(
-                    f"Permission denied when storing credentials for user {user_id}: {e}. "
-                    f"Check Firestore IAM write permissions.",
-                    exc_info=True,
-                )
-            elif "timeout" in error_str or "deadline" in error_str:
-                logger.error(
-                    f"Timeout storing credentials for user {user_id}: {e}. "
-                    f"Firestore may be experiencing latency issues.",
-                    exc_info=True,
-                )
-            elif "quota" in error_str or "rate limit" in error_str:
-                logger.error(
-                    f"Quota exceeded when storing credentials for user {user_id}: {e}. "
-                    f"Check Firestore quota limits.",
-                    exc_info=True,
+    def store_credential_batched(self, user_id: str, credentials: Credentials) -> "Future[bool]":
+        """
+        Queue OAuth credentials to be saved to Firestore in a batched write.
+
+        Writes queued within a short window (BATCH_FLUSH_INTERVAL_SECONDS) are
+        committed together in a single WriteBatch RPC, and multiple writes for the
+        same user within that window collapse into the latest one. Use this for
+        bursts of token refreshes that can tolerate eventual durability; use
+        store_credential() when the write must be committed before returning.
+
+        Args:
+            user_id: User identifier (used as document ID in Firestore)
+            credentials: Google Credentials object to store
+
+        Returns:
+            Future resolving to True once committed, or False on error
+        """
+        future: "Future[bool]" = Future()
+
+        if not user_id or not user_id.strip():
+            logger.warning("store_credential_batched called with empty user_id")
+            future.set_result(False)
+            return future
+
+        if not credentials:
+            logger.warning(f"store_credential_batched called with None credentials for user: {user_id}")
+            future.set_result(False)
+            return future
+
+        token_data = self._credentials_to_token_data(credentials)
+        if not token_data.get("token"):
+            logger.error(f"Cannot store credentials for user {user_id}: missing access token")
+            future.set_result(False)
+            return future
+
+        self._credential_cache.clear_missing(user_id)
+        self._write_queue.put((user_id, self._build_write_payload(token_data), future))
+        self._ensure_writer_thread()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until all currently queued batched writes have been committed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the batch containing the queued writes committed, False otherwise
+        """
+        marker: "Future[bool]" = Future()
+        self._write_queue.put(("", {}, marker))
+        self._ensure_writer_thread()
+        try:
+            return marker.result(timeout=timeout)
+        except Exception:
+            return False
+
+    def _ensure_writer_thread(self) -> None:
+        """Start the background batch writer thread if it is not running."""
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer_thread is None or not self._writer_thread.is_alive():
+                self._writer_thread = threading.Thread(
+                    target=self._batch_writer_loop,
+                    name="firestore-credential-writer",
+                    daemon=True,
                 )
-            else:
+                self._writer_thread.start()
+
+    def _batch_writer_loop(self) -> None:
+        """Drain the write queue, committing one WriteBatch per flush interval."""
+        while True:
+            pending = [self._write_queue.get()]
+
+            # Collect everything else that arrives within the flush window
+            deadline = time.monotonic() + BATCH_FLUSH_INTERVAL_SECONDS
+            while len(pending) < MAX_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._commit_batch(pending)
+
+    def _commit_batch(self, pending: list) -> None:
+        """
+        Commit a group of queued writes in a single WriteBatch.
+
+        Args:
+            pending: List of (user_id, payload, future) tuples. Entries with an
+                     empty user_id are flush markers resolved after the commit.
+        """
+        # Latest payload wins when a user was written several times in the window
+        writes = {}
+        futures = []
+        markers = []
+        for user_id, payload, future in pending:
+            if not user_id:
+                markers.append(future)
+                continue
+            writes[user_id] = payload
+            futures.append(future)
+
+        success = True
+        if writes:
+            try:
+                batch = self.db.batch()
+                for user_id, payload in writes.items():
+                    batch.set(self._doc(user_id), payload, merge=True)
+                batch.commit()
+                logger.info(f"Stored OAuth credentials to Firestore for {len(writes)} user(s) in one batch")
+            except Exception as e:
+                success = False
                 logger.error(
-                    f"Error storing credentials to Firestore for user {user_id}: {e}",
+                    f"Error storing batched credentials to Firestore for users {sorted(writes)}: {e}",
                     exc_info=True,
                 )
 
-            return False
+        for future in futures:
+            future.set_result(success)
+        for marker in markers:
+            marker.set_result(success)
 
     def delete_credential(self, user_id: str) -> bool:
         """
@@ -308,15 +652,10 @@ class FirestoreCredentialStore(CredentialStore):
 
         try:
             # Get document reference
-            doc_ref = self.db.collection(self.collection_name).document(user_id)
+            doc_ref = self._doc(user_id)
 
-            # Check if document exists
-            doc = doc_ref.get()
-            if not doc.exists:
-                logger.debug(f"No document to delete for user: {user_id}")
-                return True  # Consider it success if document doesn't exist
-
-            # Remove the token field (preserve other fields)
+            # Remove the token field (preserve other fields). A missing document
+            # raises NotFound, handled below, so no existence check is needed.
             doc_ref.update(
                 {
                     self.token_field: firestore.DELETE_FIELD,
@@ -327,28 +666,22 @@ class FirestoreCredentialStore(CredentialStore):
             logger.info(f"Deleted OAuth credentials from Firestore for user: {user_id}")
             return True
 
-        except Exception as e:
-            error_str = str(e).lower()
+        except NotFound:
+            logger.debug(f"No document to delete for user: {user_id}")
+            return True  # Consider it success if document doesn't exist
 
-            # Provide context-specific error messages
-            if "permission" in error_str or "forbidden" in error_str:
-                logger.error(
-                    f"Permission denied when deleting credentials for user {user_id}: {e}. "
-                    f"Check Firestore IAM write permissions.",
-                    exc_info=True,
-                )
-            elif "not found" in error_str:
-                # Document was deleted between get() and update() calls
+        except Exception as e:
+            if _classify_error("delete", e) == "not_found":
                 logger.info(f"Document not found when deleting credentials for user {user_id} (already deleted)")
                 return True
-            else:
-                logger.error(
-                    f"Error deleting credentials from Firestore for user {user_id}: {e}",
-                    exc_info=True,
-                )
-
+            logger.error(_format_error("delete", e, user_id=user_id), exc_info=True)
             return False
 
+        finally:
+            # Drop the L1 copy after the write, so a concurrent read cannot
+            # re-cache the deleted token from Firestore
+            self._credential_cache.remove(user_id)
+
     def list_users(self) -> List[str]:
         """
         List all users with stored OAuth credentials in Firestore.
@@ -357,16 +690,16 @@ class FirestoreCredentialStore(CredentialStore):
             List of user identifiers (document IDs) that have OAuth tokens
         """
         try:
-            users = []
-
-            # Query all documents in the collection
-            docs = self.db.collection(self.collection_name).stream()
+            # Only match documents that have the token field, and project just
+            # the document ID (an empty projection would return every field)
+            docs = (
+                self._collection
+                .where(filter=FieldFilter(self.token_field, "!=", None))
+                .select([FieldPath.document_id()])
+                .stream()
+            )
 
-            for doc in docs:
-                data = doc.to_dict()
-                # Only include users that have the token field
-                if data and data.get(self.token_field):
-                    users.append(doc.id)
+            users = [doc.id for doc in docs]
 
             logger.info(f"Listed {len(users)} users with OAuth credentials from Firestore")
             return sorted(users)
@@ -378,7 +711,8 @@ class FirestoreCredentialStore(CredentialStore):
             )
             return []
 
-    def _token_data_to_credentials(self, token_data: dict) -> Optional[Credentials]:
+    @staticmethod
+    def _token_data_to_credentials(token_data: dict) -> Optional[Credentials]:
         """
         Convert Firestore token data dictionary to Google Credentials object.
 
@@ -388,6 +722,23 @@ class FirestoreCredentialStore(CredentialStore):
         Returns:
             Google Credentials object or None if conversion fails
         """
+        # Fast path: data written by _credentials_to_token_data is already well-typed
+        if token_data.get("_schema") == TOKEN_DATA_SCHEMA_VERSION and token_data.get("token"):
+            try:
+                expiry = _decode_expiry(token_data.get("expiry"))
+
+                return Credentials(
+                    token=token_data["token"],
+                    refresh_token=token_data.get("refresh_token"),
+                    token_uri=token_data.get("token_uri") or DEFAULT_TOKEN_URI,
+                    client_id=token_data.get("client_id"),
+                    client_secret=token_data.get("client_secret"),
+                    scopes=token_data.get("scopes") or [],
+                    expiry=expiry,
+                )
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Fast-path token data conversion failed, validating instead: {e}")
+
         try:
             # Validate required fields
             token = token_data.get("token")
@@ -395,19 +746,25 @@ class FirestoreCredentialStore(CredentialStore):
                 logger.warning("Token data missing required 'token' field")
                 return None
 
+            # Type checks below only guard against foreign data; they are
+            # compiled out under `python -O` (__debug__ is False)
+            warn = logger.isEnabledFor(logging.WARNING)
+
             # Validate token_uri if present
-            token_uri = token_data.get("token_uri", "https://oauth2.googleapis.com/token")
-            if not token_uri or not isinstance(token_uri, str):
-                logger.warning(f"Invalid token_uri in token data: {token_uri}, using default")
-                token_uri = "https://oauth2.googleapis.com/token"
+            token_uri = token_data.get("token_uri", DEFAULT_TOKEN_URI)
+            if not token_uri or (__debug__ and not isinstance(token_uri, str)):
+                if warn:
+                    logger.warning(f"Invalid token_uri in token data: {token_uri}, using default")
+                token_uri = DEFAULT_TOKEN_URI
 
             # Validate and parse scopes
             scopes = token_data.get("scopes", [])
-            if not isinstance(scopes, list):
-                logger.warning(
-                    f"Invalid scopes type in token data: expected list, got {type(scopes).__name__}. "
-                    f"Using empty list."
-                )
+            if __debug__ and not isinstance(scopes, list):
+                if warn:
+                    logger.warning(
+                        f"Invalid scopes type in token data: expected list, got {type(scopes).__name__}. "
+                        f"Using empty list."
+                    )
                 scopes = []
 
             # Parse expiry datetime if present
@@ -415,32 +772,34 @@ class FirestoreCredentialStore(CredentialStore):
             expiry_str = token_data.get("expiry")
             if expiry_str:
                 try:
-                    if isinstance(expiry_str, str):
-                        expiry = datetime.fromisoformat(expiry_str)
-                        # Ensure timezone-naive datetime for Google auth library compatibility
-                        if expiry.tzinfo is not None:
-                            expiry = expiry.replace(tzinfo=None)
-                    else:
+                    if isinstance(expiry_str, (datetime, str)):
+                        expiry = _decode_expiry(expiry_str)
+                    elif warn:
                         logger.warning(
-                            f"Invalid expiry type in token data: expected str, got {type(expiry_str).__name__}"
+                            f"Invalid expiry type in token data: expected datetime or str, "
+                            f"got {type(expiry_str).__name__}"
                         )
                 except (ValueError, TypeError) as e:
-                    logger.warning(f"Could not parse expiry time '{expiry_str}': {e}")
+                    if warn:
+                        logger.warning(f"Could not parse expiry time '{expiry_str}': {e}")
 
             # Extract other fields with type validation
             refresh_token = token_data.get("refresh_token")
-            if refresh_token and not isinstance(refresh_token, str):
-                logger.warning(f"Invalid refresh_token type: expected str, got {type(refresh_token).__name__}")
+            if __debug__ and refresh_token and not isinstance(refresh_token, str):
+                if warn:
+                    logger.warning(f"Invalid refresh_token type: expected str, got {type(refresh_token).__name__}")
                 refresh_token = None
 
             client_id = token_data.get("client_id")
-            if client_id and not isinstance(client_id, str):
-                logger.warning(f"Invalid client_id type: expected str, got {type(client_id).__name__}")
+            if __debug__ and client_id and not isinstance(client_id, str):
+                if warn:
+                    logger.warning(f"Invalid client_id type: expected str, got {type(client_id).__name__}")
                 client_id = None
 
             client_secret = token_data.get("client_secret")
-            if client_secret and not isinstance(client_secret, str):
-                logger.warning(f"Invalid client_secret type: expected str, got {type(client_secret).__name__}")
+            if __debug__ and client_secret and not isinstance(client_secret, str):
+                if warn:
+                    logger.warning(f"Invalid client_secret type: expected str, got {type(client_secret).__name__}")
                 client_secret = None
 
             # Create Credentials object
@@ -464,7 +823,46 @@ class FirestoreCredentialStore(CredentialStore):
             )
             return None
 
-    def _credentials_to_token_data(self, credentials: Credentials) -> dict:
+    def _doc(self, user_id: str) -> firestore.DocumentReference:
+        """
+        Get the (cached) document reference for a user.
+
+        Args:
+            user_id: User identifier (used as document ID in Firestore)
+
+        Returns:
+            DocumentReference for the user's document
+        """
+        with self._doc_refs_lock:
+            doc_ref = self._doc_refs.get(user_id)
+            if doc_ref is not None:
+                self._doc_refs.move_to_end(user_id)
+                return doc_ref
+
+            doc_ref = self._collection.document(user_id)
+            self._doc_refs[user_id] = doc_ref
+            if len(self._doc_refs) > DOC_REF_CACHE_SIZE:
+                self._doc_refs.popitem(last=False)
+            return doc_ref
+
+    def _build_write_payload(self, token_data: dict) -> dict:
+        """
+        Build the document fields written when storing credentials.
+
+        Args:
+            token_data: Token data dictionary from _credentials_to_token_data
+
+        Returns:
+            Dictionary of fields to merge into the user's document
+        """
+        return {
+            self.token_field: token_data,
+            # Stamped by Firestore at commit time (single clock across instances)
+            f"{self.token_field}_connected_at": firestore.SERVER_TIMESTAMP,
+        }
+
+    @staticmethod
+    def _credentials_to_token_data(credentials: Credentials) -> dict:
         """
         Convert Google Credentials object to Firestore token data dictionary.
 
@@ -474,12 +872,23 @@ class FirestoreCredentialStore(CredentialStore):
         Returns:
             Dictionary containing token information for Firestore storage
         """
+        token, refresh_token, token_uri, client_id, client_secret, scopes, expiry = (
+            _get_credential_fields(credentials)
+        )
+
+        # Google auth uses naive UTC datetimes; store expiry as a native
+        # Firestore Timestamp so it can be queried and needs no string parsing
+        if expiry is not None and expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+
         return {
-            "token": credentials.token,
-            "refresh_token": credentials.refresh_token,
-            "token_uri": credentials.token_uri,
-            "client_id": credentials.client_id,
-            "client_secret": credentials.client_secret,
-            "scopes": credentials.scopes or [],
-            "expiry": credentials.expiry.isoformat() if credentials.expiry else None,
+            "token": token,
+            "refresh_token": refresh_token,
+            "token_uri": token_uri,
+            "client_id": client_id,
+            "client_secret": client_secret,
+            "scopes": scopes or [],
+            "expiry": expiry,
+            "expiry_epoch": int(expiry.timestamp()) if expiry else None,
+            "_schema": TOKEN_DATA_SCHEMA_VERSION,
         }
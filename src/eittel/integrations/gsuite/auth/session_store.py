@@ -3,16 +3,55 @@ Simple in-memory credential cache for Google OAuth credentials.
 
 This module provides a thread-safe, in-memory cache for Google OAuth credentials
 to avoid repeated database/filesystem reads during the same session.
+
+The cache is bounded: entries expire after a TTL (so revoked or rotated tokens
+cannot linger forever) and, once the cache reaches its maximum size, the least
+valuable of the least recently used entries is evicted. Credentials that are
+about to expire and cannot be refreshed are not admitted at all.
 """
 
 import logging
-from typing import Dict, Optional
-from threading import RLock
+import time
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
 from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterator, Optional
+from threading import RLock
 from google.oauth2.credentials import Credentials
 
 logger = logging.getLogger(__name__)
 
+# Default cache bounds
+DEFAULT_MAX_SIZE = 1024
+DEFAULT_TTL_SECONDS = 300
+
+# How long a "no stored credentials" result is remembered
+DEFAULT_NEGATIVE_TTL_SECONDS = 30
+
+# Non-refreshable credentials expiring sooner than this are not worth caching
+MIN_ADMIT_LIFETIME_SECONDS = 5
+
+# Fraction of least recently used entries considered when evicting
+EVICTION_BUCKET_FRACTION = 0.1
+
+# Tokens this close to expiry are not served by get_valid(); matches the
+# refresh threshold google-auth applies in Credentials.valid (3m45s)
+EXPIRY_MARGIN_SECONDS = 225
+
+
+class _CacheEntry:
+    """A cached credential with its insertion time, hit count and the
+    monotonic deadline until which it is known to be valid."""
+
+    __slots__ = ("credentials", "stored_at", "hits", "valid_until")
+
+    def __init__(self, credentials: Credentials, stored_at: float, valid_until: float):
+        self.credentials = credentials
+        self.stored_at = stored_at
+        self.hits = 0
+        self.valid_until = valid_until
+
 
 class CredentialCache:
     """
@@ -20,18 +59,47 @@ class CredentialCache:
 
     This cache stores credentials by user email to provide fast access
     without hitting the persistent storage (file/Firestore) on every call.
+    Entries expire after ``ttl_seconds``. When more than ``max_size`` users
+    are cached, the entry with the fewest hits among the least recently used
+    10% is evicted, so frequently used credentials survive one-off lookups.
 
     Usage:
-        >>> cache = CredentialCache()
+        >>> cache = CredentialCache(max_size=1024, ttl_seconds=300)
         >>> cache.set("user@example.com", credentials)
         >>> creds = cache.get("user@example.com")
     """
 
-    def __init__(self):
-        """Initialize the credential cache."""
-        self._cache: Dict[str, Credentials] = {}
+    def __init__(
+        self,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        """
+        Initialize the credential cache.
+
+        Args:
+            max_size: Maximum number of cached users before eviction
+            ttl_seconds: Seconds an entry stays cached before it expires
+            negative_ttl_seconds: Seconds a user is remembered as having no
+                                  stored credentials
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # user_email -> entry, ordered from least to most recently used
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # user_email -> time.monotonic() deadline for users known to have no credentials
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._missing: "OrderedDict[str, float]" = OrderedDict()
+        # user_email -> number of holders; pinned entries are never evicted
+        self._pinned: "Counter[str]" = Counter()
         self._lock = RLock()
-        logger.debug("CredentialCache initialized")
+        logger.debug(
+            f"CredentialCache initialized (max_size={max_size}, ttl_seconds={ttl_seconds})"
+        )
 
     def get(self, user_email: str) -> Optional[Credentials]:
         """
@@ -43,28 +111,83 @@ class CredentialCache:
         Returns:
             Credentials if found and valid, None otherwise
         """
-        with self._lock:
-            creds = self._cache.get(user_email)
+        # Reads are lock-free: dict lookups and OrderedDict.move_to_end are
+        # atomic under the GIL. The lock is only taken to remove an entry.
+        entry = self._cache.get(user_email)
 
-            if creds is None:
-                logger.debug(f"Cache miss for {user_email}")
-                return None
+        if entry is None:
+            logger.debug(f"Cache miss for {user_email}")
+            return None
+
+        creds = entry.credentials
+
+        # Expire entries older than the TTL
+        if time.monotonic() - entry.stored_at > self.ttl_seconds:
+            logger.debug(f"Cache entry for {user_email} expired (TTL), removing")
+            self._discard(user_email, entry)
+            return None
+
+        try:
+            self._cache.move_to_end(user_email)
+        except KeyError:
+            # Evicted or removed concurrently; the entry we read is still usable
+            pass
+        entry.hits += 1
+
+        # Check if credentials are still valid
+        if creds.valid:
+            logger.debug(f"Cache hit for {user_email} (valid)")
+            return creds
+
+        # Not valid (expired, within google-auth's refresh threshold, or
+        # without an access token) but refreshable
+        if creds.refresh_token:
+            logger.debug(f"Cache hit for {user_email} (needs refresh)")
+            return creds
+
+        # Credentials are invalid and not refreshable - remove from cache
+        logger.debug(f"Cache hit for {user_email} (invalid, removing)")
+        self._discard(user_email, entry)
+        return None
+
+    def get_valid(self, user_email: str) -> Optional[Credentials]:
+        """
+        Get credentials from cache only if they are known to be valid.
 
-            # Check if credentials are still valid
-            if creds.valid:
-                logger.debug(f"Cache hit for {user_email} (valid)")
-                return creds
+        This is a fast path for get(): validity is decided by comparing
+        time.monotonic() against a deadline computed when the entry was
+        stored, without evaluating ``credentials.valid``. A None result is
+        not final; callers should fall back to get().
 
-            # Check if expired but refreshable
-            if creds.expired and creds.refresh_token:
-                logger.debug(f"Cache hit for {user_email} (expired but refreshable)")
-                return creds
+        Args:
+            user_email: User's email address
 
-            # Credentials are invalid and not refreshable - remove from cache
-            logger.debug(f"Cache hit for {user_email} (invalid, removing)")
-            del self._cache[user_email]
+        Returns:
+            Credentials if cached and within their validity window, None otherwise
+        """
+        entry = self._cache.get(user_email)
+        if entry is None or time.monotonic() >= entry.valid_until:
             return None
 
+        try:
+            self._cache.move_to_end(user_email)
+        except KeyError:
+            pass
+        entry.hits += 1
+        return entry.credentials
+
+    def _discard(self, user_email: str, entry: _CacheEntry) -> None:
+        """
+        Remove an entry unless it was replaced since it was read.
+
+        Args:
+            user_email: User's email address
+            entry: The entry observed by the caller
+        """
+        with self._lock:
+            if self._cache.get(user_email) is entry:
+                del self._cache[user_email]
+
     def set(self, user_email: str, credentials: Credentials) -> None:
         """
         Store credentials in cache.
@@ -73,9 +196,180 @@ class CredentialCache:
             user_email: User's email address
             credentials: Google OAuth credentials
         """
+        stored_at = time.monotonic()
+        valid_until = self._valid_until(user_email, credentials, stored_at)
+        if valid_until is None:
+            return
+
         with self._lock:
-            self._cache[user_email] = credentials
-            logger.debug(f"Cached credentials for {user_email}")
+            self._missing.pop(user_email, None)
+            self._cache[user_email] = _CacheEntry(credentials, stored_at, valid_until)
+            self._cache.move_to_end(user_email)
+
+            while len(self._cache) > self.max_size:
+                evicted = self._select_victim()
+                if evicted is None:
+                    # Everything evictable is pinned; allow a temporary overshoot
+                    break
+                del self._cache[evicted]
+                logger.debug(f"Evicted cached credentials for {evicted}")
+
+        logger.debug(f"Cached credentials for {user_email}")
+
+    def _valid_until(
+        self, user_email: str, credentials: Credentials, stored_at: float
+    ) -> Optional[float]:
+        """
+        Compute the monotonic deadline until which credentials count as valid.
+
+        Args:
+            user_email: User's email address
+            credentials: Google OAuth credentials
+            stored_at: time.monotonic() at which they are stored
+
+        Returns:
+            The deadline, or None if the credentials should not be cached
+        """
+        valid_until = stored_at + self.ttl_seconds
+
+        if not credentials.token:
+            # Never valid without a token; get_valid() always defers to get()
+            return stored_at
+        if credentials.expiry is not None:
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            remaining = (credentials.expiry - now).total_seconds()
+
+            # Admission: caching a token that expires in moments and cannot be
+            # refreshed only displaces entries that would actually be hit
+            if credentials.refresh_token is None and remaining < MIN_ADMIT_LIFETIME_SECONDS:
+                logger.debug(f"Not caching credentials for {user_email} (expiring, not refreshable)")
+                return None
+
+            valid_until = min(valid_until, stored_at + remaining - EXPIRY_MARGIN_SECONDS)
+        return valid_until
+
+    def replace(self, user_email: str, credentials: Credentials) -> bool:
+        """
+        Swap in new credentials for an existing entry (e.g. after a background
+        refresh) without re-admitting the user.
+
+        The entry keeps its insertion time and hit count, so the TTL still
+        runs from the last real lookup and idle users age out as usual.
+
+        Args:
+            user_email: User's email address
+            credentials: Google OAuth credentials
+
+        Returns:
+            True if an entry was updated, False if the user is not cached
+        """
+        with self._lock:
+            entry = self._cache.get(user_email)
+            if entry is None or time.monotonic() - entry.stored_at > self.ttl_seconds:
+                return False
+            valid_until = self._valid_until(user_email, credentials, entry.stored_at)
+            if valid_until is None:
+                return False
+            entry.credentials = credentials
+            entry.valid_until = valid_until
+        logger.debug(f"Replaced cached credentials for {user_email}")
+        return True
+
+    def _select_victim(self) -> Optional[str]:
+        """
+        Choose the entry to evict. Must be called with the lock held.
+
+        Among the least recently used bucket, the entry with the lowest
+        ``hits + recency_rank`` is evicted (rank 0 is least recently used).
+        This orders entries the same as a log(hits + rank) value score.
+        Pinned entries (see pinned()) are skipped.
+
+        Returns:
+            The user email of the entry to evict, or None if the bucket only
+            holds pinned entries
+        """
+        bucket_size = max(1, int(len(self._cache) * EVICTION_BUCKET_FRACTION))
+        # Snapshot the bucket in one call so lock-free readers reordering the
+        # dict cannot invalidate the iteration
+        bucket = list(islice(self._cache.items(), bucket_size + len(self._pinned)))
+        victim = None
+        best_score = None
+        for rank, (user_email, entry) in enumerate(bucket):
+            if user_email in self._pinned:
+                continue
+            score = entry.hits + rank
+            if best_score is None or score < best_score:
+                victim, best_score = user_email, score
+        return victim
+
+    @contextmanager
+    def pinned(self, user_email: str) -> Iterator[None]:
+        """
+        Keep a user's entry from being evicted for the duration of a block.
+
+        Used while a user's token is being refreshed, so eviction cannot race
+        with the refresh writing the new credentials back.
+
+        Args:
+            user_email: User's email address
+        """
+        with self._lock:
+            self._pinned[user_email] += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._pinned[user_email] -= 1
+                if self._pinned[user_email] <= 0:
+                    del self._pinned[user_email]
+
+    def mark_missing(self, user_email: str) -> None:
+        """
+        Remember that a user has no stored credentials.
+
+        For ``negative_ttl_seconds``, is_missing() returns True so callers can
+        skip the persistent-storage lookup for this user.
+
+        Args:
+            user_email: User's email address
+        """
+        with self._lock:
+            self._missing[user_email] = time.monotonic() + self.negative_ttl_seconds
+            self._missing.move_to_end(user_email)
+            while len(self._missing) > self.max_size:
+                self._missing.popitem(last=False)
+        logger.debug(f"Cached missing credentials for {user_email}")
+
+    def is_missing(self, user_email: str) -> bool:
+        """
+        Check whether a user is known to have no stored credentials.
+
+        Args:
+            user_email: User's email address
+
+        Returns:
+            True if the user was marked missing and the mark has not expired
+        """
+        deadline = self._missing.get(user_email)
+        if deadline is None:
+            return False
+        if time.monotonic() > deadline:
+            with self._lock:
+                if self._missing.get(user_email) == deadline:
+                    del self._missing[user_email]
+            return False
+        logger.debug(f"Negative cache hit for {user_email}")
+        return True
+
+    def clear_missing(self, user_email: str) -> None:
+        """
+        Forget that a user has no stored credentials (e.g. after storing some).
+
+        Args:
+            user_email: User's email address
+        """
+        with self._lock:
+            self._missing.pop(user_email, None)
 
     def remove(self, user_email: str) -> bool:
         """
@@ -99,8 +393,28 @@ class CredentialCache:
         with self._lock:
             count = len(self._cache)
             self._cache.clear()
+            self._missing.clear()
             logger.debug(f"Cleared {count} cached credentials")
 
+    def snapshot(self) -> list[tuple[str, Credentials]]:
+        """
+        List unexpired cached (user, credentials) pairs without touching hit
+        counts or recency (e.g. for background maintenance).
+
+        Entries past their TTL are left out, so maintenance never acts for
+        users who have not been looked up within ``ttl_seconds``.
+
+        Returns:
+            List of (user email, credentials) tuples
+        """
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            return [
+                (user_email, entry.credentials)
+                for user_email, entry in self._cache.items()
+                if entry.stored_at >= cutoff
+            ]
+
     def list_users(self) -> list[str]:
         """
         List all users with cached credentials.
@@ -5,19 +5,82 @@ This module provides a clean, framework-agnostic client for Google Calendar API
 """
 
 import asyncio
+import concurrent.futures
 import datetime
-import json
+import functools
+import io
 import logging
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
+CALENDAR_IO_MAX_WORKERS = 8
+
+# Dedicated pool for blocking API calls, shared by all clients in this module so
+# they don't contend with other work on the loop's default executor
+_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=CALENDAR_IO_MAX_WORKERS, thread_name_prefix="gcal-io"
+)
+
+# All-day event dates (YYYY-MM-DD)
+_DATE_ONLY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\Z")
+
+# Section dividers for formatted output
+_DIVIDER_80_EQ = "=" * 80
+_DIVIDER_80_DASH = "-" * 80
+
+# Fixed header lines of each event in get_events output
+_EVENT_TEMPLATE = "\nEvent: {summary}\nID: {event_id}\nStart: {start_str}\nEnd: {end_str}\n"
+
 
 # ==============================================================================
 # Helper Functions (Pure utility functions, no service dependency)
 # ==============================================================================
 
+def _validate_reminders(reminders: Any) -> None:
+    """
+    Check that reminders are a list of dicts with 'method' and 'minutes' keys.
+
+    Args:
+        reminders: Parsed reminders value
+
+    Raises:
+        ValueError: If the structure is invalid (message without function prefix)
+    """
+    if not isinstance(reminders, list):
+        raise ValueError("Reminders JSON must be a list")
+    for reminder in reminders:
+        if not isinstance(reminder, dict):
+            raise ValueError("Each reminder must be a dictionary")
+        if "method" not in reminder or "minutes" not in reminder:
+            raise ValueError("Each reminder must have 'method' and 'minutes' keys")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_reminders_cached(reminders_json: str) -> Tuple[Tuple[Tuple[str, Any], ...], ...]:
+    """
+    Parse and validate a reminders JSON string, caching the result.
+
+    Args:
+        reminders_json: Reminders as a JSON string
+
+    Returns:
+        Immutable form of the reminders: one tuple of (key, value) items per reminder
+
+    Raises:
+        ValueError: If the JSON is invalid or the structure is wrong
+    """
+    try:
+        parsed = orjson.loads(reminders_json)
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON for reminders: {e}")
+    _validate_reminders(parsed)
+    return tuple(tuple(reminder.items()) for reminder in parsed)
+
+
 def _parse_reminders_json(
     reminders_input: Optional[Union[str, List[Dict[str, Any]]]],
     function_name: str
@@ -38,39 +101,44 @@ def _parse_reminders_json(
     if reminders_input is None:
         return []
 
-    # If already a list, validate and return
-    if isinstance(reminders_input, list):
-        for reminder in reminders_input:
-            if not isinstance(reminder, dict):
-                raise ValueError(f"{function_name}: Each reminder must be a dictionary")
-            if "method" not in reminder or "minutes" not in reminder:
-                raise ValueError(
-                    f"{function_name}: Each reminder must have 'method' and 'minutes' keys"
-                )
-        return reminders_input
-
-    # If string, parse as JSON
-    if isinstance(reminders_input, str):
-        try:
-            parsed = json.loads(reminders_input)
-            if not isinstance(parsed, list):
-                raise ValueError(f"{function_name}: Reminders JSON must be a list")
-            for reminder in parsed:
-                if not isinstance(reminder, dict):
-                    raise ValueError(f"{function_name}: Each reminder must be a dictionary")
-                if "method" not in reminder or "minutes" not in reminder:
-                    raise ValueError(
-                        f"{function_name}: Each reminder must have 'method' and 'minutes' keys"
-                    )
-            return parsed
-        except json.JSONDecodeError as e:
-            raise ValueError(f"{function_name}: Invalid JSON for reminders: {e}")
+    try:
+        # If already a list, validate and return
+        if isinstance(reminders_input, list):
+            _validate_reminders(reminders_input)
+            return reminders_input
+
+        # If string, parse as JSON (repeated templates hit the cache)
+        if isinstance(reminders_input, str):
+            return [dict(items) for items in _parse_reminders_cached(reminders_input)]
+    except ValueError as e:
+        raise ValueError(f"{function_name}: {e}") from None
 
     raise ValueError(
         f"{function_name}: reminders must be a JSON string or a list of dictionaries"
     )
 
 
+def _format_attendee_line(attendee: Dict[str, Any], indent: str) -> str:
+    """
+    Format a single attendee for display.
+
+    Args:
+        attendee: Attendee dictionary
+        indent: String indentation for formatting
+
+    Returns:
+        Formatted attendee line
+    """
+    name = attendee.get("displayName", "")
+    return (
+        f"{indent}- {attendee.get('email', 'N/A')}"
+        f"{f' ({name})' if name else ''}"
+        f" [{'Organizer, ' if attendee.get('organizer', False) else ''}"
+        f"{'Optional, ' if attendee.get('optional', False) else ''}"
+        f"Status: {attendee.get('responseStatus', 'needsAction')}]"
+    )
+
+
 def _format_attendee_details(attendees: List[Dict[str, Any]], indent: str = "  ") -> str:
     """
     Format attendee details for display.
@@ -85,35 +153,14 @@ def _format_attendee_details(attendees: List[Dict[str, Any]], indent: str = "  "
     if not attendees:
         return f"{indent}(No attendees)"
 
-    lines = []
-    for attendee in attendees:
-        email = attendee.get("email", "N/A")
-        name = attendee.get("displayName", "")
-        response = attendee.get("responseStatus", "needsAction")
-        optional = attendee.get("optional", False)
-        organizer = attendee.get("organizer", False)
-
-        attendee_str = f"{indent}- {email}"
-        if name:
-            attendee_str += f" ({name})"
-
-        tags = []
-        if organizer:
-            tags.append("Organizer")
-        if optional:
-            tags.append("Optional")
-        tags.append(f"Status: {response}")
-
-        attendee_str += f" [{', '.join(tags)}]"
-        lines.append(attendee_str)
-
-    return "\n".join(lines)
+    return "\n".join(_format_attendee_line(attendee, indent) for attendee in attendees)
 
 
 def _correct_time_format_for_api(
     datetime_str: Optional[str],
     timezone_str: Optional[str],
-    field_name: str
+    field_name: str,
+    validate: bool = True
 ) -> Dict[str, str]:
     """
     Validate and format datetime for Google Calendar API.
@@ -122,6 +169,8 @@ def _correct_time_format_for_api(
         datetime_str: DateTime string (ISO format or date-only)
         timezone_str: Timezone string (e.g., "America/New_York")
         field_name: Field name for error messages
+        validate: Whether to parse datetime strings to check their format;
+            pass False for strings the caller already generated as ISO 8601
 
     Returns:
         Dictionary with 'dateTime'/'date' and 'timeZone' keys
@@ -132,25 +181,101 @@ def _correct_time_format_for_api(
     if not datetime_str:
         raise ValueError(f"{field_name} is required")
 
-    # Check if it's a date-only format (YYYY-MM-DD)
-    date_only_pattern = r"^\d{4}-\d{2}-\d{2}$"
-    if re.match(date_only_pattern, datetime_str):
+    # Check if it's a date-only format (YYYY-MM-DD); the length/dash check
+    # keeps datetime strings from reaching the regex at all
+    if (
+        len(datetime_str) == 10
+        and datetime_str[4] == "-"
+        and datetime_str[7] == "-"
+        and _DATE_ONLY_RE.match(datetime_str)
+    ):
         # All-day event
         return {"date": datetime_str}
 
     # DateTime format - validate ISO 8601
-    try:
-        # Try parsing to validate format
-        datetime.datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-        result = {"dateTime": datetime_str}
-        if timezone_str:
-            result["timeZone"] = timezone_str
-        return result
-    except ValueError as e:
-        raise ValueError(
-            f"Invalid {field_name} format: {datetime_str}. "
-            f"Use ISO 8601 format (e.g., '2024-03-15T10:00:00') or date format (YYYY-MM-DD). Error: {e}"
-        )
+    if validate:
+        try:
+            # Try parsing to validate format (fromisoformat accepts a trailing "Z"
+            # on Python 3.11+, so no rewrite to "+00:00" is needed)
+            datetime.datetime.fromisoformat(datetime_str)
+        except ValueError as e:
+            raise ValueError(
+                f"Invalid {field_name} format: {datetime_str}. "
+                f"Use ISO 8601 format (e.g., '2024-03-15T10:00:00') or date format (YYYY-MM-DD). Error: {e}"
+            )
+    result = {"dateTime": datetime_str}
+    if timezone_str:
+        result["timeZone"] = timezone_str
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def _reminders_block_cached(reminders_json: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Render a reminders JSON string into the event 'reminders' block, caching
+    the result.
+
+    Args:
+        reminders_json: Reminders as a JSON string
+
+    Returns:
+        Immutable form of the block as (key, value) items, with the overrides
+        as one tuple of (key, value) items per reminder
+
+    Raises:
+        ValueError: If the JSON is invalid or the structure is wrong
+    """
+    return (("useDefault", False), ("overrides", _parse_reminders_cached(reminders_json)))
+
+
+def _build_reminders_block(
+    reminders: Union[str, List[Dict[str, Any]]],
+    function_name: str
+) -> Dict[str, Any]:
+    """
+    Build the 'reminders' section of an event body.
+
+    Args:
+        reminders: Reminders as JSON string or list of dicts
+        function_name: Name of calling function (for error messages)
+
+    Returns:
+        Reminders dictionary with default reminders disabled
+
+    Raises:
+        ValueError: If reminders format is invalid
+    """
+    if isinstance(reminders, str):
+        # Bulk-created events repeat the same reminders template; the block
+        # is rendered once and copied so each event body stays mutable
+        try:
+            (_, use_default), (_, overrides) = _reminders_block_cached(reminders)
+        except ValueError as e:
+            raise ValueError(f"{function_name}: {e}") from None
+        return {
+            "useDefault": use_default,
+            "overrides": [dict(items) for items in overrides]
+        }
+
+    return {
+        "useDefault": False,
+        "overrides": _parse_reminders_json(reminders, function_name)
+    }
+
+
+async def _run_blocking(func, *args):
+    """
+    Run a blocking callable on the module's I/O thread pool.
+
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+
+    Returns:
+        Result of func(*args)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_EXECUTOR, functools.partial(func, *args))
 
 
 # ==============================================================================
@@ -183,6 +308,9 @@ class CalendarClient:
             service: Authenticated Google Calendar API service object
         """
         self.service = service
+        # Resource wrappers are built once; each call only builds its request
+        self._calendar_list_resource = service.calendarList()
+        self._events_resource = service.events()
         logger.debug("CalendarClient initialized")
 
     async def list_calendars(self) -> str:
@@ -195,39 +323,42 @@ class CalendarClient:
         Example:
             >>> calendars = await calendar.list_calendars()
         """
+        return "".join([chunk async for chunk in self.iter_calendars()])
+
+    async def iter_calendars(self) -> AsyncIterator[str]:
+        """
+        Stream the formatted calendar list, one chunk per calendar.
+
+        Yields:
+            The "Found N calendar(s)" header, then one formatted block per calendar
+
+        Example:
+            >>> async for chunk in calendar.iter_calendars():
+            ...     print(chunk, end="")
+        """
         logger.info("[list_calendars] Fetching calendar list")
 
-        calendar_list = await asyncio.to_thread(
-            self.service.calendarList().list().execute
+        calendar_list = await _run_blocking(
+            self._calendar_list_resource.list().execute
         )
 
         calendars = calendar_list.get("items", [])
 
         if not calendars:
-            return "No calendars found."
+            yield "No calendars found."
+            return
 
-        output_lines = [
-            f"Found {len(calendars)} calendar(s):",
-            ""
-        ]
+        yield f"Found {len(calendars)} calendar(s):\n"
 
         for cal in calendars:
             cal_id = cal.get("id", "N/A")
             summary = cal.get("summary", "Unnamed Calendar")
-            primary = cal.get("primary", False)
+            primary = " (Primary)" if cal.get("primary", False) else ""
             access_role = cal.get("accessRole", "N/A")
 
-            cal_str = f"- {summary}"
-            if primary:
-                cal_str += " (Primary)"
-            cal_str += f" [Access: {access_role}]"
-            cal_str += f"\n  ID: {cal_id}"
-
-            output_lines.append(cal_str)
-            output_lines.append("")
+            yield f"\n- {summary}{primary} [Access: {access_role}]\n  ID: {cal_id}\n"
 
         logger.info(f"[list_calendars] Listed {len(calendars)} calendars")
-        return "\n".join(output_lines)
 
     async def get_events(
         self,
@@ -257,6 +388,41 @@ class CalendarClient:
             ...     max_results=5
             ... )
         """
+        return "".join([
+            chunk async for chunk in self.iter_events(
+                calendar_id=calendar_id,
+                max_results=max_results,
+                time_min=time_min,
+                time_max=time_max,
+                query=query,
+            )
+        ])
+
+    async def iter_events(
+        self,
+        calendar_id: str = "primary",
+        max_results: int = 10,
+        time_min: Optional[str] = None,
+        time_max: Optional[str] = None,
+        query: Optional[str] = None
+    ) -> AsyncIterator[str]:
+        """
+        Stream formatted events from a calendar, one chunk per event.
+
+        Args:
+            calendar_id: Calendar ID (default: "primary")
+            max_results: Maximum number of events (default: 10)
+            time_min: Start time filter (ISO format, optional)
+            time_max: End time filter (ISO format, optional)
+            query: Search query (optional)
+
+        Yields:
+            The "Found N event(s)" header, then one formatted block per event
+
+        Example:
+            >>> async for chunk in calendar.iter_events(max_results=50):
+            ...     print(chunk, end="")
+        """
         logger.info(f"[get_events] Calendar: {calendar_id}, Max: {max_results}")
 
         params = {
@@ -273,52 +439,44 @@ class CalendarClient:
         if query:
             params["q"] = query
 
-        events_result = await asyncio.to_thread(
-            self.service.events().list(**params).execute
+        events_result = await _run_blocking(
+            self._events_resource.list(**params).execute
         )
 
         events = events_result.get("items", [])
 
         if not events:
-            return "No events found."
+            yield "No events found."
+            return
 
-        output_lines = [
-            f"Found {len(events)} event(s):",
-            "=" * 80,
-            ""
-        ]
+        yield f"Found {len(events)} event(s):\n{_DIVIDER_80_EQ}\n"
 
         for event in events:
-            event_id = event.get("id", "N/A")
-            summary = event.get("summary", "(No title)")
             start = event.get("start", {})
             end = event.get("end", {})
             description = event.get("description", "")
             location = event.get("location", "")
             attendees = event.get("attendees", [])
 
-            start_str = start.get("dateTime", start.get("date", "N/A"))
-            end_str = end.get("dateTime", end.get("date", "N/A"))
-
-            output_lines.extend([
-                f"Event: {summary}",
-                f"ID: {event_id}",
-                f"Start: {start_str}",
-                f"End: {end_str}",
-            ])
+            output = io.StringIO()
+            output.write(_EVENT_TEMPLATE.format_map({
+                "summary": event.get("summary", "(No title)"),
+                "event_id": event.get("id", "N/A"),
+                "start_str": start.get("dateTime", start.get("date", "N/A")),
+                "end_str": end.get("dateTime", end.get("date", "N/A")),
+            }))
 
             if location:
-                output_lines.append(f"Location: {location}")
+                output.write(f"Location: {location}\n")
             if description:
-                output_lines.append(f"Description: {description[:200]}...")
+                output.write(f"Description: {description[:200]}...\n")
             if attendees:
-                output_lines.append("Attendees:")
-                output_lines.append(_format_attendee_details(attendees))
+                output.write(f"Attendees:\n{_format_attendee_details(attendees)}\n")
 
-            output_lines.extend(["", "-" * 80, ""])
+            output.write(f"\n{_DIVIDER_80_DASH}\n")
+            yield output.getvalue()
 
         logger.info(f"[get_events] Retrieved {len(events)} events")
-        return "\n".join(output_lines)
 
     async def create_event(
         self,
@@ -330,7 +488,8 @@ class CalendarClient:
         location: Optional[str] = None,
         attendees: Optional[List[str]] = None,
         timezone: Optional[str] = None,
-        reminders: Optional[Union[str, List[Dict[str, Any]]]] = None
+        reminders: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        validate_times: bool = True
     ) -> str:
         """
         Create a new calendar event.
@@ -345,6 +504,8 @@ class CalendarClient:
             attendees: List of attendee emails (optional)
             timezone: Timezone (e.g., "America/New_York", optional)
             reminders: Reminders as JSON or list (optional)
+            validate_times: Parse start/end times to check their format (default: True).
+                Bulk publishers passing pre-validated ISO strings can disable it.
 
         Returns:
             Success message with event ID and link
@@ -362,8 +523,12 @@ class CalendarClient:
         # Build event object
         event = {
             "summary": summary,
-            "start": _correct_time_format_for_api(start_time, timezone, "start_time"),
-            "end": _correct_time_format_for_api(end_time, timezone, "end_time"),
+            "start": _correct_time_format_for_api(
+                start_time, timezone, "start_time", validate=validate_times
+            ),
+            "end": _correct_time_format_for_api(
+                end_time, timezone, "end_time", validate=validate_times
+            ),
         }
 
         if description:
@@ -373,15 +538,11 @@ class CalendarClient:
         if attendees:
             event["attendees"] = [{"email": email} for email in attendees]
         if reminders:
-            parsed_reminders = _parse_reminders_json(reminders, "create_event")
-            event["reminders"] = {
-                "useDefault": False,
-                "overrides": parsed_reminders
-            }
+            event["reminders"] = _build_reminders_block(reminders, "create_event")
 
         # Create the event
-        created_event = await asyncio.to_thread(
-            self.service.events().insert(calendarId=calendar_id, body=event).execute
+        created_event = await _run_blocking(
+            self._events_resource.insert(calendarId=calendar_id, body=event).execute
         )
 
         event_id = created_event.get("id")
@@ -410,8 +571,8 @@ class CalendarClient:
         """
         logger.info(f"[delete_event] Deleting event: {event_id}")
 
-        await asyncio.to_thread(
-            self.service.events().delete(
+        await _run_blocking(
+            self._events_resource.delete(
                 calendarId=calendar_id,
                 eventId=event_id
             ).execute
@@ -6,15 +6,44 @@ This module provides a clean, framework-agnostic client for Gmail API operations
 
 import asyncio
 import base64
+import concurrent.futures
+import functools
+import io
 import logging
+from collections import deque
+from email.header import Header
 from email.mime.text import MIMEText
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    # SIMD-accelerated decoder, same semantics as the stdlib function
+    from pybase64 import urlsafe_b64decode as _b64d
+except ImportError:
+    _b64d = base64.urlsafe_b64decode
 
 logger = logging.getLogger(__name__)
 
 GMAIL_BATCH_SIZE = 25
+
+# Most requests the Gmail batch endpoint accepts in one batch
+GMAIL_BATCH_MAX_REQUESTS = 100
 GMAIL_REQUEST_DELAY = 0.1
+GMAIL_IO_MAX_WORKERS = 8
 HTML_BODY_TRUNCATE_LIMIT = 20000
+MAX_LINE_LENGTH = 998  # RFC 5322 limit for unencoded lines
+
+# Section dividers for formatted output
+_DIVIDER_80_EQ = "=" * 80
+_DIVIDER_40_DASH = "-" * 40
+
+# Headers shown when formatting a message or thread
+_DEFAULT_HEADER_SET = frozenset({"From", "To", "Subject", "Date", "Cc", "Bcc"})
+
+# Dedicated pool for blocking API calls, shared by all clients in this module so
+# they don't contend with other work on the loop's default executor
+_IO_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=GMAIL_IO_MAX_WORKERS, thread_name_prefix="gmail-io"
+)
 
 
 # ==============================================================================
@@ -33,52 +62,126 @@ def _extract_message_body(payload):
     Returns:
         str: The plain text body content, or empty string if not found
     """
-    bodies = _extract_message_bodies(payload)
+    bodies = _extract_message_bodies(payload, want=("text",))
     return bodies.get("text", "")
 
 
-def _extract_message_bodies(payload):
+def _extract_message_bodies(payload, want=("text", "html")):
     """
     Extract both plain text and HTML bodies from a Gmail message payload.
 
+    Parts are walked depth-first in document order; the first text/plain and
+    first text/html parts found are decoded, and traversal stops once every
+    wanted body is found. HTML bodies are cut to HTML_BODY_TRUNCATE_LIMIT
+    characters, and long ones are cut before UTF-8 decoding; 'html_length'
+    keeps the full length for the truncation notice, in bytes when
+    'html_length_in_bytes' is set (the body was cut before decoding).
+
     Args:
         payload (dict): The message payload from Gmail API
+        want (tuple): Bodies to decode ('text' and/or 'html'); the others are
+            skipped and left empty
 
     Returns:
-        dict: Dictionary with 'text' and 'html' keys containing respective body content
+        dict: Dictionary with 'text' and 'html' keys containing respective body content,
+            'html_length' with the untruncated HTML length and
+            'html_length_in_bytes' telling whether that length counts bytes
+            rather than characters
     """
-    result = {"text": "", "html": ""}
-
-    def traverse(part):
-        if "parts" in part:
-            for subpart in part["parts"]:
-                traverse(subpart)
-        elif part.get("mimeType") == "text/plain":
-            data = part.get("body", {}).get("data")
-            if data:
-                try:
-                    result["text"] = base64.urlsafe_b64decode(data).decode("utf-8")
-                except Exception as e:
-                    logger.warning(f"Failed to decode text/plain body: {e}")
-        elif part.get("mimeType") == "text/html":
-            data = part.get("body", {}).get("data")
-            if data:
-                try:
-                    result["html"] = base64.urlsafe_b64decode(data).decode("utf-8")
-                except Exception as e:
-                    logger.warning(f"Failed to decode text/html body: {e}")
-
-    traverse(payload)
-    return result
-
-
-def _format_body_content(text_body: str, html_body: str) -> str:
+    return _extract_all(payload, frozenset(), want)[1]
+
+
+def _extract_all(
+    payload: dict,
+    want_headers: frozenset,
+    want_bodies: Tuple[str, ...] = ("text", "html"),
+) -> Tuple[Dict[str, str], dict]:
+    """
+    Extract headers and bodies from a Gmail message payload in one call.
+
+    Headers are read from the top-level payload (see _extract_headers) and
+    bodies are decoded as in _extract_message_bodies.
+
+    Args:
+        payload: Message payload
+        want_headers: Header names to extract
+        want_bodies: Bodies to decode ('text' and/or 'html')
+
+    Returns:
+        Tuple of (headers dict, bodies dict)
+    """
+    headers = {}
+    if want_headers:
+        for header in payload.get("headers", []):
+            name = header.get("name")
+            if name in want_headers:
+                headers[name] = header.get("value", "")
+                if len(headers) == len(want_headers):
+                    break
+
+    result = {"text": "", "html": "", "html_length": 0, "html_length_in_bytes": False}
+
+    stack = deque([payload])
+    while stack:
+        part = stack.pop()
+
+        subparts = part.get("parts")
+        if subparts:
+            stack.extend(reversed(subparts))
+            continue
+
+        mime_type = part.get("mimeType")
+        if mime_type == "text/plain":
+            key = "text"
+        elif mime_type == "text/html":
+            key = "html"
+        else:
+            continue
+
+        if key not in want_bodies or result[key]:
+            continue
+
+        data = part.get("body", {}).get("data")
+        if data:
+            try:
+                raw = _b64d(data)
+                if key == "text":
+                    result["text"] = raw.decode("utf-8", errors="replace")
+                elif len(raw) > HTML_BODY_TRUNCATE_LIMIT * 4:
+                    # Any 4 * limit bytes decode to at least `limit` characters;
+                    # the total is then reported in bytes, not characters
+                    html = raw[:HTML_BODY_TRUNCATE_LIMIT * 4].decode("utf-8", errors="replace")
+                    result["html"] = html[:HTML_BODY_TRUNCATE_LIMIT]
+                    result["html_length"] = len(raw)
+                    result["html_length_in_bytes"] = True
+                else:
+                    html = raw.decode("utf-8", errors="replace")
+                    result["html"] = html[:HTML_BODY_TRUNCATE_LIMIT]
+                    result["html_length"] = len(html)
+            except Exception as e:
+                logger.warning(f"Failed to decode {mime_type} body: {e}")
+
+        if all(result[k] for k in want_bodies):
+            break
+
+    return headers, result
+
+
+def _format_body_content(
+    text_body: str,
+    html_body: str,
+    html_length: int = 0,
+    html_length_in_bytes: bool = False,
+) -> str:
     """
     Format body content for LLM consumption with length limiting.
 
     Args:
         text_body: Plain text body content
-        html_body: HTML body content
+        html_body: HTML body content (possibly already truncated)
+        html_length: Untruncated HTML length, if html_body was cut during extraction
+        html_length_in_bytes: Whether html_length counts UTF-8 bytes rather
+            than characters
 
     Returns:
         Formatted body string, truncated if needed
@@ -86,28 +189,37 @@ def _format_body_content(text_body: str, html_body: str) -> str:
     if text_body:
         return text_body
     elif html_body:
-        if len(html_body) > HTML_BODY_TRUNCATE_LIMIT:
-            return f"{html_body[:HTML_BODY_TRUNCATE_LIMIT]}...[truncated, {len(html_body)} total chars]"
+        total_length = html_length or len(html_body)
+        if total_length > HTML_BODY_TRUNCATE_LIMIT:
+            unit = "bytes" if html_length and html_length_in_bytes else "chars"
+            return f"{html_body[:HTML_BODY_TRUNCATE_LIMIT]}...[truncated, {total_length} total {unit}]"
         return html_body
     return "(No body content)"
 
 
-def _extract_headers(payload: dict, header_names: List[str]) -> Dict[str, str]:
+def _extract_headers(payload: dict, header_names: Iterable[str]) -> Dict[str, str]:
     """
     Extract specific headers from message payload.
 
     Args:
         payload: Message payload
-        header_names: List of header names to extract
+        header_names: Header names to extract (a set or frozenset is used as-is)
 
     Returns:
         Dictionary mapping header names to values
     """
+    if isinstance(header_names, (set, frozenset)):
+        wanted = header_names
+    else:
+        wanted = frozenset(header_names)
+
     headers = {}
     for header in payload.get("headers", []):
         name = header.get("name")
-        if name in header_names:
+        if name in wanted:
             headers[name] = header.get("value", "")
+            if len(headers) == len(wanted):
+                break
     return headers
 
 
@@ -137,25 +249,76 @@ def _prepare_gmail_message(
     Returns:
         Dictionary containing the prepared message
     """
-    message = MIMEText(body)
-    message["To"] = to
-    message["Subject"] = subject
-
+    headers = [("To", to), ("Subject", subject)]
     if from_email:
-        message["From"] = from_email
+        headers.append(("From", from_email))
     if cc:
-        message["Cc"] = cc
+        headers.append(("Cc", cc))
     if bcc:
-        message["Bcc"] = bcc
+        headers.append(("Bcc", bcc))
     if in_reply_to:
-        message["In-Reply-To"] = in_reply_to
+        headers.append(("In-Reply-To", in_reply_to))
     if references:
-        message["References"] = references
+        headers.append(("References", references))
 
-    raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode("utf-8")
+    raw_bytes = _build_plain_text_message(headers, body)
+    if raw_bytes is None:
+        # Headers the fast path can't encode safely go through the email package
+        message = MIMEText(body)
+        for name, value in headers:
+            message[name] = value
+        raw_bytes = message.as_bytes()
+
+    raw_message = base64.urlsafe_b64encode(raw_bytes).decode("utf-8")
     return {"raw": raw_message}
 
 
+def _build_plain_text_message(headers: List[Tuple[str, str]], body: str) -> Optional[bytes]:
+    """
+    Serialize a text/plain email directly, without email.generator.
+
+    ASCII bodies with short lines are sent as 7bit; anything else is sent as
+    base64-encoded UTF-8 (the same encodings MIMEText would choose). A
+    non-ASCII Subject is RFC 2047 encoded.
+
+    Args:
+        headers: (name, value) pairs in the order they should appear
+        body: Plain text body
+
+    Returns:
+        The RFC 5322 message bytes, or None if a header needs encoding or
+        folding this builder does not handle (line breaks, non-ASCII outside
+        Subject, or a line longer than MAX_LINE_LENGTH)
+    """
+    lines = []
+    for name, value in headers:
+        if "\r" in value or "\n" in value:
+            return None
+        if not value.isascii():
+            if name != "Subject":
+                return None
+            value = Header(value, "utf-8").encode()
+        line = f"{name}: {value}"
+        if len(line) > MAX_LINE_LENGTH:
+            # Long To/Cc/References lines must be folded; leave that to the
+            # email package
+            return None
+        lines.append(line)
+
+    if body.isascii() and all(len(line) <= MAX_LINE_LENGTH for line in body.splitlines()):
+        lines.append('Content-Type: text/plain; charset="us-ascii"')
+        lines.append("MIME-Version: 1.0")
+        lines.append("Content-Transfer-Encoding: 7bit")
+        encoded_body = body
+    else:
+        lines.append('Content-Type: text/plain; charset="utf-8"')
+        lines.append("MIME-Version: 1.0")
+        lines.append("Content-Transfer-Encoding: base64")
+        encoded_body = base64.encodebytes(body.encode("utf-8")).decode("ascii")
+
+    return ("\n".join(lines) + "\n\n" + encoded_body).encode("ascii")
+
+
 def _generate_gmail_web_url(item_id: str, account_index: int = 0) -> str:
     """
     Generate a Gmail web interface URL for a message or thread.
@@ -170,6 +333,26 @@ def _generate_gmail_web_url(item_id: str, account_index: int = 0) -> str:
     return f"https://mail.google.com/mail/u/{account_index}/#all/{item_id}"
 
 
+def _format_search_result(idx: int, msg: dict) -> str:
+    """
+    Format one search result entry, including its trailing blank line.
+
+    Args:
+        idx: 1-based position of the message in the results
+        msg: Message object from Gmail API (id and threadId only)
+
+    Returns:
+        Formatted entry
+    """
+    msg_id = msg.get("id", "N/A")
+    return (
+        f"{idx}. Message ID: {msg_id}\n"
+        f"   Thread ID: {msg.get('threadId', 'N/A')}\n"
+        f"   Gmail URL: {_generate_gmail_web_url(msg_id)}\n"
+        "\n"
+    )
+
+
 def _format_gmail_results_plain(messages: list, query: str) -> str:
     """
     Format Gmail search results in a plain, LLM-friendly format.
@@ -184,32 +367,62 @@ def _format_gmail_results_plain(messages: list, query: str) -> str:
     if not messages:
         return f"No messages found matching query: '{query}'"
 
-    output_lines = [
-        f"Found {len(messages)} message(s) matching query: '{query}'",
-        "",
-        "Results:",
-        "--------",
-    ]
-
-    for idx, msg in enumerate(messages, 1):
-        msg_id = msg.get("id", "N/A")
-        thread_id = msg.get("threadId", "N/A")
-        web_url = _generate_gmail_web_url(msg_id)
-
-        output_lines.extend(
-            [
-                f"{idx}. Message ID: {msg_id}",
-                f"   Thread ID: {thread_id}",
-                f"   Gmail URL: {web_url}",
-                "",
-            ]
-        )
+    # One fragment per message, joined once with the header and footer
+    entries = "".join(
+        _format_search_result(idx, msg) for idx, msg in enumerate(messages, 1)
+    )
 
-    output_lines.append(
+    return (
+        f"Found {len(messages)} message(s) matching query: '{query}'\n"
+        "\n"
+        "Results:\n"
+        "--------\n"
+        f"{entries}"
         "To get full message content, use get_gmail_message_content() with the Message ID."
     )
 
-    return "\n".join(output_lines)
+
+def _render_thread_message(msg: dict, idx: int, total: int) -> str:
+    """
+    Format a single message of a thread for LLM consumption.
+
+    Args:
+        msg: Message data from Gmail API
+        idx: 1-based position of the message in the thread
+        total: Number of messages in the thread
+
+    Returns:
+        Formatted message fragment
+    """
+    msg_id = msg.get("id", "N/A")
+    payload = msg.get("payload", {})
+
+    headers, bodies = _extract_all(payload, _DEFAULT_HEADER_SET)
+    body_content = _format_body_content(
+        bodies.get("text", ""),
+        bodies.get("html", ""),
+        bodies.get("html_length", 0),
+        bodies.get("html_length_in_bytes", False),
+    )
+
+    output = io.StringIO()
+    output.write(
+        f"\n\nMessage {idx}/{total}:\n"
+        f"Message ID: {msg_id}\n"
+        f"From: {headers.get('From', 'N/A')}\n"
+        f"To: {headers.get('To', 'N/A')}\n"
+        f"Subject: {headers.get('Subject', 'N/A')}\n"
+        f"Date: {headers.get('Date', 'N/A')}"
+    )
+
+    if headers.get("Cc"):
+        output.write(f"\nCc: {headers['Cc']}")
+    if headers.get("Bcc"):
+        output.write(f"\nBcc: {headers['Bcc']}")
+
+    output.write(f"\n\nBody:\n{_DIVIDER_40_DASH}\n{body_content}\n{_DIVIDER_40_DASH}")
+
+    return output.getvalue()
 
 
 def _format_thread_content(thread_data: dict, thread_id: str) -> str:
@@ -227,47 +440,36 @@ def _format_thread_content(thread_data: dict, thread_id: str) -> str:
     if not messages:
         return f"Thread {thread_id} contains no messages."
 
-    output_lines = [
-        f"Thread ID: {thread_id}",
-        f"Number of messages: {len(messages)}",
-        f"Gmail URL: {_generate_gmail_web_url(thread_id)}",
-        "",
-        "Messages in thread:",
-        "=" * 80,
-    ]
-
-    for idx, msg in enumerate(messages, 1):
-        msg_id = msg.get("id", "N/A")
-        payload = msg.get("payload", {})
-
-        headers = _extract_headers(
-            payload, ["From", "To", "Subject", "Date", "Cc", "Bcc"]
-        )
-
-        bodies = _extract_message_bodies(payload)
-        body_content = _format_body_content(
-            bodies.get("text", ""), bodies.get("html", "")
+    # Rendered inline: decoding and formatting are GIL-bound Python work,
+    # which worker threads would not parallelize
+    total = len(messages)
+    return (
+        f"Thread ID: {thread_id}\n"
+        f"Number of messages: {total}\n"
+        f"Gmail URL: {_generate_gmail_web_url(thread_id)}\n"
+        f"\n"
+        f"Messages in thread:\n"
+        f"{_DIVIDER_80_EQ}"
+        + "".join(
+            _render_thread_message(msg, idx, total)
+            for idx, msg in enumerate(messages, 1)
         )
+    )
 
-        output_lines.extend(
-            [
-                f"\nMessage {idx}/{len(messages)}:",
-                f"Message ID: {msg_id}",
-                f"From: {headers.get('From', 'N/A')}",
-                f"To: {headers.get('To', 'N/A')}",
-                f"Subject: {headers.get('Subject', 'N/A')}",
-                f"Date: {headers.get('Date', 'N/A')}",
-            ]
-        )
 
-        if headers.get("Cc"):
-            output_lines.append(f"Cc: {headers['Cc']}")
-        if headers.get("Bcc"):
-            output_lines.append(f"Bcc: {headers['Bcc']}")
+async def _run_blocking(func, *args):
+    """
+    Run a blocking callable on the module's I/O thread pool.
 
-        output_lines.extend(["", "Body:", "-" * 40, body_content, "-" * 40])
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
 
-    return "\n".join(output_lines)
+    Returns:
+        Result of func(*args)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_EXECUTOR, functools.partial(func, *args))
 
 
 # ==============================================================================
@@ -300,6 +502,8 @@ class GmailClient:
             service: Authenticated Gmail API service object
         """
         self.service = service
+        # Resource wrapper is built once; each call only builds its request
+        self._messages_resource = service.users().messages()
         logger.debug("GmailClient initialized")
 
     async def search_messages(self, query: str, page_size: int = 10) -> str:
@@ -321,10 +525,8 @@ class GmailClient:
         """
         logger.info(f"[search_messages] Query: '{query}', Page size: {page_size}")
 
-        response = await asyncio.to_thread(
-            self.service.users()
-            .messages()
-            .list(userId="me", q=query, maxResults=page_size)
+        response = await _run_blocking(
+            self._messages_resource.list(userId="me", q=query, maxResults=page_size)
             .execute
         )
 
@@ -353,21 +555,18 @@ class GmailClient:
         """
         logger.info(f"[get_message_content] Message ID: {message_id}")
 
-        message = await asyncio.to_thread(
-            self.service.users()
-            .messages()
-            .get(userId="me", id=message_id, format="full")
+        message = await _run_blocking(
+            self._messages_resource.get(userId="me", id=message_id, format="full")
             .execute
         )
 
         payload = message.get("payload", {})
-        headers = _extract_headers(
-            payload, ["From", "To", "Subject", "Date", "Cc", "Bcc"]
-        )
-
-        bodies = _extract_message_bodies(payload)
+        headers, bodies = _extract_all(payload, _DEFAULT_HEADER_SET)
         body_content = _format_body_content(
-            bodies.get("text", ""), bodies.get("html", "")
+            bodies.get("text", ""),
+            bodies.get("html", ""),
+            bodies.get("html_length", 0),
+            bodies.get("html_length_in_bytes", False),
         )
 
         output_lines = [
@@ -386,11 +585,59 @@ class GmailClient:
         if headers.get("Bcc"):
             output_lines.append(f"Bcc: {headers['Bcc']}")
 
-        output_lines.extend(["", "Body:", "-" * 40, body_content, "-" * 40])
+        output_lines.extend(["", "Body:", _DIVIDER_40_DASH, body_content, _DIVIDER_40_DASH])
 
         logger.info(f"[get_message_content] Retrieved message: {message_id}")
         return "\n".join(output_lines)
 
+    async def get_messages_bulk(self, message_ids: List[str]) -> Dict[str, dict]:
+        """
+        Fetch several Gmail messages using batched HTTP requests.
+
+        Requests are grouped into batches of GMAIL_BATCH_SIZE (at most
+        GMAIL_BATCH_MAX_REQUESTS), each sent as a single multipart HTTP request
+        to the Gmail batch endpoint.
+
+        Args:
+            message_ids: Gmail message IDs to fetch; duplicates are fetched once
+
+        Returns:
+            Dictionary mapping message ID to the full message resource.
+            Messages that could not be fetched are omitted (and logged).
+
+        Example:
+            >>> messages = await gmail.get_messages_bulk(["18c1...", "18c2..."])
+        """
+        # Message IDs double as batch request IDs, which must be unique
+        message_ids = list(dict.fromkeys(message_ids))
+        batch_size = min(GMAIL_BATCH_SIZE, GMAIL_BATCH_MAX_REQUESTS)
+
+        logger.info(f"[get_messages_bulk] Fetching {len(message_ids)} messages")
+
+        results: Dict[str, dict] = {}
+
+        def _on_response(request_id, response, exception):
+            if exception is not None:
+                logger.warning(f"[get_messages_bulk] Failed to fetch message {request_id}: {exception}")
+            elif response is not None:
+                results[request_id] = response
+
+        for chunk_start in range(0, len(message_ids), batch_size):
+            if chunk_start:
+                # Brief pause between batches to stay under per-user rate limits
+                await asyncio.sleep(GMAIL_REQUEST_DELAY)
+
+            batch = self.service.new_batch_http_request(callback=_on_response)
+            for message_id in message_ids[chunk_start:chunk_start + batch_size]:
+                batch.add(
+                    self._messages_resource.get(userId="me", id=message_id, format="full"),
+                    request_id=message_id,
+                )
+            await _run_blocking(batch.execute)
+
+        logger.info(f"[get_messages_bulk] Retrieved {len(results)}/{len(message_ids)} messages")
+        return results
+
     async def send_message(
         self,
         to: str,
@@ -425,8 +672,8 @@ class GmailClient:
             to=to, subject=subject, body=body, cc=cc, bcc=bcc
         )
 
-        result = await asyncio.to_thread(
-            self.service.users().messages().send(userId="me", body=send_body).execute
+        result = await _run_blocking(
+            self._messages_resource.send(userId="me", body=send_body).execute
         )
 
         message_id = result.get("id")
@@ -12,16 +12,463 @@ Key features:
 - L1 (memory) + L2 (persistent) credential caching
 """
 
-from typing import Callable, Optional
-
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+import google_auth_httplib2
+import httplib2
+import requests
 from google.adk.tools import FunctionTool
 from google.adk.tools.tool_context import ToolContext
+from google.auth import exceptions as auth_exceptions
 from google.auth.transport.requests import Request
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.http import HttpRequest, build_http
 
 from ...gsuite.auth import (
     get_credential_cache,
     get_credential_store,
 )
+from ...gsuite.gcalendar.client import CalendarClient
+from ...gsuite.gmail.client import GmailClient
+
+logger = logging.getLogger(__name__)
+
+# Client wrapper class per Google API service name
+_CLIENT_FACTORIES: dict[str, Callable[[Any], Any]] = {
+    "gmail": GmailClient,
+    "calendar": CalendarClient,
+}
+
+SERVICE_CACHE_MAX_SIZE = 1024
+SERVICE_CACHE_TTL_SECONDS = 3600
+
+# Connections kept open to the OAuth token endpoint. Refreshes run on the
+# default executor (at most 32 threads), and requests' default pool of 10
+# would drop the connections of concurrent refreshes beyond that.
+AUTH_POOL_MAXSIZE = 32
+
+
+def _build_auth_request() -> Request:
+    """
+    Build the shared transport for token refreshes.
+
+    Returns:
+        A google-auth Request over one requests.Session, whose pooled
+        connections are reused across refreshes and users
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=AUTH_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    return Request(session=session)
+
+
+_AUTH_REQUEST = _build_auth_request()
+
+# user_id -> future for the storage lookup in progress, shared by concurrent
+# tool calls for the same user
+_INFLIGHT_LOOKUPS: dict[str, asyncio.Future] = {}
+
+# user_id -> Future of the token refresh in progress for that user; concurrent
+# callers await it instead of refreshing again
+_INFLIGHT_REFRESHES: dict[str, asyncio.Future] = {}
+
+# Background refresh of cached tokens that are about to expire, so tool calls
+# rarely have to refresh inline
+PROACTIVE_REFRESH_INTERVAL_SECONDS = 60
+PROACTIVE_REFRESH_WINDOW_SECONDS = 300
+PROACTIVE_REFRESH_RETRY_SECONDS = 300
+
+_proactive_refresh_task: Optional[asyncio.Task] = None
+# Global credential store in effect when the task was started
+_proactive_refresh_store = None
+# user_id -> time.monotonic() of the last failed background refresh
+_last_refresh_attempt: dict[str, float] = {}
+
+# Transient refresh failures (network errors, OAuth endpoint 5xx) open a
+# per-user circuit: inline refreshes are skipped until it closes instead of
+# every tool call waiting on a failing endpoint
+REFRESH_FAILURE_COOLDOWN_SECONDS = 30
+
+# user_id -> time.monotonic() deadline before which refreshes are skipped
+_REFRESH_FAIL_UNTIL: dict[str, float] = {}
+
+# Idle httplib2.Http objects; each keeps its connections to Google APIs open
+# so requests skip the TCP/TLS handshake. An Http is used by one request at a
+# time (it is not thread-safe), so the pool grows to the peak concurrency.
+_HTTP_POOL: "queue.SimpleQueue[httplib2.Http]" = queue.SimpleQueue()
+
+# (service_name, service_version) -> discovery document JSON (None if not bundled)
+_DISCOVERY_DOCS: dict[tuple[str, str], Optional[str]] = {}
+
+# (service_name, service_version, id(credentials)) -> (credentials, client, built_at).
+# The entry holds the credentials object itself, so its id cannot be reused
+# by another object while the entry exists.
+_SERVICE_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def _extract_user_id(tool_context: ToolContext) -> Optional[str]:
+    """
+    Get the ID of the user a tool call runs for.
+
+    Uses ToolContext's public user_id property rather than reaching into
+    its private invocation context.
+
+    Args:
+        tool_context: ADK tool context
+
+    Returns:
+        The user ID, or None if the invocation has none
+    """
+    return tool_context.user_id
+
+
+def _is_transient_refresh_error(error: Exception) -> bool:
+    """
+    Tell a temporary refresh failure from revoked or invalid credentials.
+
+    Args:
+        error: Exception raised by the refresh
+
+    Returns:
+        True for transport errors and errors google-auth marks retryable
+    """
+    if isinstance(error, auth_exceptions.TransportError):
+        return True
+    return isinstance(error, auth_exceptions.GoogleAuthError) and error.retryable
+
+
+def _refresh_circuit_open(user_id: str) -> bool:
+    """
+    Check whether refreshes for a user are paused after a transient failure.
+
+    Args:
+        user_id: User identifier
+
+    Returns:
+        True if the user's refresh cooldown has not elapsed
+    """
+    deadline = _REFRESH_FAIL_UNTIL.get(user_id)
+    if deadline is None:
+        return False
+    if time.monotonic() < deadline:
+        return True
+    _REFRESH_FAIL_UNTIL.pop(user_id, None)
+    return False
+
+
+async def _refresh_and_save(
+    user_id: str, creds, credential_store, credential_cache, proactive: bool = False
+) -> None:
+    """
+    Refresh credentials off the event loop and save them to storage and cache.
+
+    Args:
+        user_id: User identifier
+        creds: Credentials with a refresh token
+        credential_store: L2 credential store
+        credential_cache: L1 credential cache
+        proactive: Background refresh; only update an existing cache entry
+                   instead of (re)admitting the user
+
+    Raises:
+        Exception: If the refresh fails
+    """
+    def _refresh_and_store():
+        creds.refresh(_AUTH_REQUEST)
+        credential_store.store_credential(user_id, creds)
+
+    # Keep the user's cache entry from being evicted mid-refresh
+    with credential_cache.pinned(user_id):
+        # Both the token request and the storage write block: run them in
+        # one worker-thread hop
+        await asyncio.to_thread(_refresh_and_store)
+        if proactive:
+            credential_cache.replace(user_id, creds)
+        else:
+            credential_cache.set(user_id, creds)
+
+
+async def _refresh_once(
+    user_id: str, creds, credential_store, credential_cache, proactive: bool = False
+):
+    """
+    Refresh a user's credentials, sharing one refresh among concurrent callers.
+
+    The first caller performs the refresh; callers arriving while it is in
+    flight await the same result (or exception) instead of spending another
+    OAuth round trip.
+
+    Args:
+        user_id: User identifier
+        creds: Credentials with a refresh token
+        credential_store: L2 credential store
+        credential_cache: L1 credential cache
+        proactive: Background refresh of a token inside the proactive window.
+                   Skips the get_valid() shortcut (which already treats tokens
+                   within EXPIRY_MARGIN_SECONDS of expiry as valid) and does
+                   not re-admit the user to the cache
+
+    Returns:
+        The refreshed credentials
+
+    Raises:
+        Exception: If the refresh fails
+    """
+    loop = asyncio.get_running_loop()
+    inflight = _INFLIGHT_REFRESHES.get(user_id)
+    if inflight is not None and inflight.get_loop() is loop:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if not inflight.cancelled():
+                raise
+            # The shared refresh was cancelled, not us: do our own
+            return await _refresh_once(
+                user_id, creds, credential_store, credential_cache, proactive
+            )
+
+    if not proactive:
+        # A refresh may have completed since the caller read the cache
+        refreshed = credential_cache.get_valid(user_id)
+        if refreshed is not None:
+            return refreshed
+
+    inflight = loop.create_future()
+    _INFLIGHT_REFRESHES[user_id] = inflight
+    try:
+        await _refresh_and_save(user_id, creds, credential_store, credential_cache, proactive)
+    except asyncio.CancelledError:
+        inflight.cancel()
+        raise
+    except BaseException as e:
+        inflight.set_exception(e)
+        # Mark retrieved so an unawaited failure is not reported twice
+        inflight.exception()
+        raise
+    else:
+        inflight.set_result(creds)
+        return creds
+    finally:
+        if _INFLIGHT_REFRESHES.get(user_id) is inflight:
+            del _INFLIGHT_REFRESHES[user_id]
+
+
+async def _refresh_expiring_credentials(credential_store, credential_cache) -> None:
+    """
+    Refresh cached credentials expiring within PROACTIVE_REFRESH_WINDOW_SECONDS.
+
+    Only users looked up within the cache TTL are considered, and a refresh
+    does not extend their TTL, so idle users stop being refreshed once their
+    entry expires. Users whose background refresh failed are retried after
+    PROACTIVE_REFRESH_RETRY_SECONDS; tool calls still refresh inline if needed.
+
+    Args:
+        credential_store: L2 credential store
+        credential_cache: L1 credential cache
+    """
+    now_monotonic = time.monotonic()
+
+    for user_id, attempted_at in list(_last_refresh_attempt.items()):
+        if now_monotonic - attempted_at >= PROACTIVE_REFRESH_RETRY_SECONDS:
+            del _last_refresh_attempt[user_id]
+    for user_id, deadline in list(_REFRESH_FAIL_UNTIL.items()):
+        if now_monotonic >= deadline:
+            _REFRESH_FAIL_UNTIL.pop(user_id, None)
+
+    for user_id, creds in credential_cache.snapshot():
+        if not creds.refresh_token or creds.expiry is None:
+            continue
+        # Earlier refreshes in this pass may have taken a while, and an inline
+        # refresh may have renewed this token meanwhile
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if (creds.expiry - now).total_seconds() > PROACTIVE_REFRESH_WINDOW_SECONDS:
+            continue
+        if user_id in _last_refresh_attempt or user_id in _REFRESH_FAIL_UNTIL:
+            continue
+
+        try:
+            await _refresh_once(
+                user_id, creds, credential_store, credential_cache, proactive=True
+            )
+            logger.debug(f"Proactively refreshed token for user {user_id}")
+        except Exception as e:
+            _last_refresh_attempt[user_id] = time.monotonic()
+            logger.warning(f"Background token refresh failed for user {user_id}: {e}")
+
+
+async def _proactive_refresh_loop(get_store: Callable[[], Any], credential_cache) -> None:
+    """
+    Periodically refresh cached credentials before they expire.
+
+    Args:
+        get_store: Returns the L2 credential store; called on every pass so
+                   refreshed tokens are saved to the store currently in use
+        credential_cache: L1 credential cache
+    """
+    while True:
+        await asyncio.sleep(PROACTIVE_REFRESH_INTERVAL_SECONDS)
+        try:
+            await _refresh_expiring_credentials(get_store(), credential_cache)
+        except Exception as e:
+            logger.error(f"Proactive token refresh pass failed: {e}", exc_info=True)
+
+
+def _ensure_proactive_refresh(credential_cache) -> None:
+    """
+    Start the background refresh task on the running loop, once per process.
+
+    The task is restarted if its loop went away or set_credential_store()
+    replaced the global store since it started; a restart also forgets the
+    failed-refresh backoff recorded against the previous store.
+
+    Args:
+        credential_cache: L1 credential cache
+    """
+    global _proactive_refresh_task, _proactive_refresh_store
+    loop = asyncio.get_running_loop()
+    store = get_credential_store()
+    task = _proactive_refresh_task
+    if task is not None and not task.done() and task.get_loop() is loop:
+        if store is _proactive_refresh_store:
+            return
+        task.cancel()
+        _last_refresh_attempt.clear()
+    _proactive_refresh_store = store
+    _proactive_refresh_task = loop.create_task(
+        _proactive_refresh_loop(get_credential_store, credential_cache)
+    )
+
+
+class _PooledHttpRequest(HttpRequest):
+    """
+    HttpRequest that borrows a keep-alive Http from _HTTP_POOL for each
+    execution and authorizes it with the request's credentials.
+    """
+
+    credentials = None
+
+    def execute(self, http=None, num_retries=0):
+        if http is not None or self.credentials is None:
+            return super().execute(http=http, num_retries=num_retries)
+
+        try:
+            pooled = _HTTP_POOL.get_nowait()
+        except queue.Empty:
+            # Same timeout and redirect settings as googleapiclient's default
+            pooled = build_http()
+        try:
+            authorized = google_auth_httplib2.AuthorizedHttp(self.credentials, http=pooled)
+            return super().execute(http=authorized, num_retries=num_retries)
+        finally:
+            _HTTP_POOL.put(pooled)
+
+
+def _load_discovery_document(service_name: str, service_version: str) -> Optional[str]:
+    """
+    Load the discovery document bundled with googleapiclient, once per API.
+
+    build_from_document() mutates a parsed document, so the JSON string is
+    kept and parsed per build.
+
+    Args:
+        service_name: Google API service name (e.g., 'gmail', 'calendar')
+        service_version: API version (e.g., 'v1', 'v3')
+
+    Returns:
+        Discovery document JSON, or None if the API is not bundled
+    """
+    key = (service_name, service_version)
+    if key not in _DISCOVERY_DOCS:
+        _DISCOVERY_DOCS[key] = discovery_cache.get_static_doc(service_name, service_version)
+    return _DISCOVERY_DOCS[key]
+
+
+def _get_client(
+    service_name: str,
+    service_version: str,
+    credentials,
+    client_factory: Callable[[Any], Any],
+) -> Any:
+    """
+    Get an API client wrapper for the given credentials, building the Google
+    API service and its wrapper at most once per credentials object (per TTL
+    window).
+
+    Services are built with a request builder that executes every request on
+    an Http borrowed from _HTTP_POOL, since httplib2.Http is not thread-safe
+    and a cached service can be used by concurrent tool calls.
+
+    Args:
+        service_name: Google API service name (e.g., 'gmail', 'calendar')
+        service_version: API version (e.g., 'v1', 'v3')
+        credentials: Valid Google credentials
+        client_factory: Wrapper class taking the service (e.g., GmailClient)
+
+    Returns:
+        Client wrapper around the googleapiclient Resource
+    """
+    key = (service_name, service_version, id(credentials))
+    now = time.monotonic()
+
+    with _SERVICE_CACHE_LOCK:
+        entry = _SERVICE_CACHE.get(key)
+        if entry is not None:
+            cached_credentials, client, built_at = entry
+            if cached_credentials is credentials and now - built_at < SERVICE_CACHE_TTL_SECONDS:
+                _SERVICE_CACHE.move_to_end(key)
+                return client
+            del _SERVICE_CACHE[key]
+
+    def _build_request(http, *args, **kwargs):
+        # The request's own Http is only used when it is executed with an
+        # explicit Http or as part of a BatchHttpRequest
+        new_http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+        request = _PooledHttpRequest(new_http, *args, **kwargs)
+        request.credentials = credentials
+        return request
+
+    # Build outside the lock: parsing the discovery document is the slow part.
+    # build_http() keeps googleapiclient's defaults (60s socket timeout, no
+    # 308 redirects), as build(credentials=...) used before.
+    http = google_auth_httplib2.AuthorizedHttp(credentials, http=build_http())
+    document = _load_discovery_document(service_name, service_version)
+    if document is not None:
+        service = build_from_document(document, http=http, requestBuilder=_build_request)
+    else:
+        service = build(service_name, service_version, http=http, requestBuilder=_build_request)
+    client = client_factory(service)
+
+    with _SERVICE_CACHE_LOCK:
+        _SERVICE_CACHE[key] = (credentials, client, now)
+        _SERVICE_CACHE.move_to_end(key)
+        while len(_SERVICE_CACHE) > SERVICE_CACHE_MAX_SIZE:
+            _SERVICE_CACHE.popitem(last=False)
+
+    return client
+
+
+def _evict_clients(credentials) -> None:
+    """
+    Drop cached API clients built for a credentials object.
+
+    Args:
+        credentials: Credentials that can no longer be used (e.g. refresh failed)
+    """
+    with _SERVICE_CACHE_LOCK:
+        stale = [key for key, entry in _SERVICE_CACHE.items() if entry[0] is credentials]
+        for key in stale:
+            del _SERVICE_CACHE[key]
 
 
 class EittelGoogleTool(FunctionTool):
@@ -41,6 +488,23 @@ class EittelGoogleTool(FunctionTool):
     pre-authorized through your web application before using these tools.
     """
 
+    # FunctionTool instances keep a __dict__; slots hold this class's own
+    # per-tool state out of it
+    __slots__ = (
+        "hidden_param_name",
+        "scopes",
+        "service_name",
+        "service_version",
+        "_credential_store",
+        "credential_cache",
+        "_client_factory",
+        "_auth_required_result",
+        "_valid_params",
+        "_mandatory_args",
+        "_mandatory_arg_set",
+        "_is_coroutine",
+    )
+
     def __init__(
         self,
         func: Callable,
@@ -70,10 +534,55 @@ class EittelGoogleTool(FunctionTool):
         self.service_name = service_name
         self.service_version = service_version
 
-        # Initialize credential storage
-        self.credential_store = get_credential_store()
+        # Initialize credential storage; the store follows the global one
+        # (see credential_store) unless explicitly assigned
+        self._credential_store = None
         self.credential_cache = get_credential_cache()
 
+        # Pick the client wrapper once; None is reported as an error at call time
+        self._client_factory = _CLIENT_FACTORIES.get(service_name)
+
+        # Result returned when the user has not authorized this service; a
+        # copy is handed out per call so callers may mutate it
+        self._auth_required_result = {
+            "status": "error",
+            "error_type": "authorization_required",
+            "message": (
+                f"User authorization is required to access {service_name.title()}. "
+                "Please complete the authorization flow in the web application."
+            ),
+        }
+
+        # Reflect on the tool function once; run_async reuses the results
+        signature = inspect.signature(func)
+        self._valid_params = frozenset(signature.parameters)
+        self._mandatory_args = tuple(
+            name
+            for name, param in signature.parameters.items()
+            if param.default is inspect.Parameter.empty
+            and param.kind not in (
+                inspect.Parameter.VAR_POSITIONAL,
+                inspect.Parameter.VAR_KEYWORD,
+            )
+        )
+        self._mandatory_arg_set = frozenset(self._mandatory_args)
+        self._is_coroutine = inspect.iscoroutinefunction(func)
+
+    @property
+    def credential_store(self):
+        """
+        L2 credential store used by this tool.
+
+        Resolved on each access unless assigned, so tools built before a
+        set_credential_store() call (e.g. shared tool sets) use the new store.
+        """
+        store = self._credential_store
+        return store if store is not None else get_credential_store()
+
+    @credential_store.setter
+    def credential_store(self, store) -> None:
+        self._credential_store = store
+
     async def _get_valid_credentials(self, tool_context: ToolContext):
         """
         Get valid credentials for the current user.
@@ -91,49 +600,144 @@ class EittelGoogleTool(FunctionTool):
             Valid credentials or None if user needs to authorize
         """
         # Get the actual user making this request
-        user_id = tool_context._invocation_context.user_id
+        user_id = _extract_user_id(tool_context)
         if not user_id:
             raise ValueError(
-                "Cannot identify user: tool_context.invocation_context.user_id is None"
+                "Cannot identify user: tool_context.user_id is None"
             )
 
-        # L1: Check in-memory cache
-        creds = self.credential_cache.get(user_id)
+        # L1: Check in-memory cache (monotonic deadline first, then creds.valid)
+        credential_cache = self.credential_cache
+        creds = credential_cache.get_valid(user_id)
+        if creds is not None:
+            return creds
+        creds = credential_cache.get(user_id)
         if creds and creds.valid:
             return creds
 
-        # L2: Check persistent storage
-        import logging
-        logger = logging.getLogger(__name__)
+        # L1 only keeps invalid credentials that are expired but refreshable:
+        # refresh them in place instead of re-reading storage
+        if creds is not None and creds.refresh_token:
+            return await self._refresh_credentials(user_id, creds)
+
+        # Users recently found unauthorized are not looked up again until the
+        # negative cache entry expires (storing new tokens clears it)
+        if credential_cache.is_missing(user_id):
+            return None
+
+        # Concurrent tool calls for the same user (e.g. several tools fired in
+        # one agent turn) share a single storage lookup
+        loop = asyncio.get_running_loop()
+        inflight = _INFLIGHT_LOOKUPS.get(user_id)
+        if inflight is not None and inflight.get_loop() is loop:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The shared lookup was cancelled, not us: do our own
+                return await self._load_stored_credentials(user_id)
+
+        inflight = loop.create_future()
+        _INFLIGHT_LOOKUPS[user_id] = inflight
+        try:
+            creds = await self._load_stored_credentials(user_id)
+        except asyncio.CancelledError:
+            inflight.cancel()
+            raise
+        except BaseException as e:
+            inflight.set_exception(e)
+            # Mark retrieved so an unawaited failure is not reported twice
+            inflight.exception()
+            raise
+        else:
+            inflight.set_result(creds)
+            return creds
+        finally:
+            if _INFLIGHT_LOOKUPS.get(user_id) is inflight:
+                del _INFLIGHT_LOOKUPS[user_id]
+
+    async def _load_stored_credentials(self, user_id: str):
+        """
+        Load credentials from persistent storage, refreshing them if expired.
+
+        Args:
+            user_id: User identifier
 
-        creds = self.credential_store.get_credential(user_id)
+        Returns:
+            Valid credentials or None if user needs to authorize
+        """
+        # L2: Check persistent storage (blocking IO, kept off the event loop)
+        creds = await asyncio.to_thread(self.credential_store.get_credential, user_id)
         if creds:
-            logger.info(f"Found credentials for user {user_id} in storage (valid={creds.valid}, expired={creds.expired})")
+            # The message evaluates creds.valid/expired, so skip it when INFO is off
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Found credentials for user {user_id} in storage (valid={creds.valid}, expired={creds.expired})")
             if creds.valid:
+                # A refresh that finished while storage was being read has
+                # already cached newer credentials; keep those
+                cached = self.credential_cache.get_valid(user_id)
+                if cached is not None:
+                    return cached
                 # Cache for next time
                 self.credential_cache.set(user_id, creds)
                 return creds
 
-            # Try to refresh expired token
-            if creds.expired and creds.refresh_token:
-                try:
-                    logger.info(f"Refreshing expired token for user {user_id}")
-                    creds.refresh(Request())
-                    # Save refreshed credentials
-                    self.credential_store.store_credential(user_id, creds)
-                    self.credential_cache.set(user_id, creds)
-                    logger.info(f"Successfully refreshed token for user {user_id}")
-                    return creds
-                except Exception as e:
-                    # Refresh failed - credentials are invalid
-                    logger.error(f"Failed to refresh token for user {user_id}: {e}")
-                    return None
+            # Not valid: expired, about to expire (creds.valid already turns
+            # False within google-auth's refresh threshold) or stored without
+            # an access token. Refresh whenever a refresh token is available.
+            if creds.refresh_token:
+                return await self._refresh_credentials(user_id, creds)
         else:
             logger.warning(f"No credentials found for user {user_id} in storage")
 
         # No credentials found or refresh failed
+        self.credential_cache.mark_missing(user_id)
         return None
 
+    async def _refresh_credentials(self, user_id: str, creds):
+        """
+        Refresh expired credentials and save them to storage and cache.
+
+        This is the fallback for tokens the background refresh task has not
+        renewed in time.
+
+        Args:
+            user_id: User identifier
+            creds: Expired credentials with a refresh token
+
+        Returns:
+            Refreshed credentials or None if the refresh failed
+        """
+        if _refresh_circuit_open(user_id):
+            logger.debug(f"Skipping token refresh for user {user_id} (recent transient failure)")
+            return None
+
+        try:
+            logger.info(f"Refreshing expired token for user {user_id}")
+            creds = await _refresh_once(
+                user_id, creds, self.credential_store, self.credential_cache
+            )
+            logger.info(f"Successfully refreshed token for user {user_id}")
+            return creds
+        except Exception as e:
+            if _is_transient_refresh_error(e):
+                # The credentials may still be good: keep them cached and
+                # retry once the cooldown has passed
+                _REFRESH_FAIL_UNTIL[user_id] = time.monotonic() + REFRESH_FAILURE_COOLDOWN_SECONDS
+                logger.warning(
+                    f"Token refresh for user {user_id} failed transiently, "
+                    f"retrying after {REFRESH_FAILURE_COOLDOWN_SECONDS}s: {e}"
+                )
+                return None
+
+            # Refresh failed - credentials are invalid
+            logger.error(f"Failed to refresh token for user {user_id}: {e}")
+            self.credential_cache.remove(user_id)
+            _evict_clients(creds)
+            self.credential_cache.mark_missing(user_id)
+            return None
+
     async def run_async(self, args: dict, tool_context: ToolContext):
         """
         Execute the tool with credential handling.
@@ -149,38 +753,33 @@ class EittelGoogleTool(FunctionTool):
             Tool execution result or error message
         """
         try:
-            # Get valid credentials
-            credentials = await self._get_valid_credentials(tool_context)
+            _ensure_proactive_refresh(self.credential_cache)
 
-            if credentials is None:
-                return {
-                    "status": "error",
-                    "error_type": "authorization_required",
-                    "message": (
-                        f"User authorization is required to access {self.service_name.title()}. "
-                        "Please complete the authorization flow in the web application."
+            # Get valid credentials
+            if (self.service_name, self.service_version) in _DISCOVERY_DOCS:
+                credentials = await self._get_valid_credentials(tool_context)
+            else:
+                # First call for this API: read the discovery document while
+                # the credentials are being loaded
+                credentials, _ = await asyncio.gather(
+                    self._get_valid_credentials(tool_context),
+                    asyncio.to_thread(
+                        _load_discovery_document, self.service_name, self.service_version
                     ),
-                }
+                )
 
-            # Build Google API service
-            from googleapiclient.discovery import build
+            if credentials is None:
+                return self._auth_required_result.copy()
 
-            service = build(
-                self.service_name, self.service_version, credentials=credentials
-            )
+            if self._client_factory is None:
+                raise ValueError(f"Unknown service: {self.service_name}")
 
-            # Create client instance
+            # Get (or build once) the client for these credentials
             # The func expects the client as first parameter
             # We need to pass it dynamically
-            from ...gsuite.gcalendar.client import CalendarClient
-            from ...gsuite.gmail.client import GmailClient
-
-            if self.service_name == "gmail":
-                client = GmailClient(service)
-            elif self.service_name == "calendar":
-                client = CalendarClient(service)
-            else:
-                raise ValueError(f"Unknown service: {self.service_name}")
+            client = _get_client(
+                self.service_name, self.service_version, credentials, self._client_factory
+            )
 
             # Execute the tool function with the client
             # Inject the client into args using the correct hidden param name
@@ -191,49 +790,42 @@ class EittelGoogleTool(FunctionTool):
             # Filter args to only include valid parameters for the function
             # This is critical - FunctionTool does this filtering, but since we override
             # run_async(), we must do it ourselves to remove ADK internal params like 'input_stream'
-            import inspect
-            signature = inspect.signature(self.func)
-            valid_params = {param for param in signature.parameters}
-            filtered_args = {k: v for k, v in args.items() if k in valid_params}
+            if args.keys() <= self._valid_params:
+                # Common case: no ADK-internal keys to strip
+                filtered_args = args
+            else:
+                filtered_args = {k: args[k] for k in self._valid_params.intersection(args)}
 
             # Check for missing mandatory arguments (same as FunctionTool does)
             # This prevents confusing errors when LLM doesn't provide required params
-            mandatory_args = []
-            for name, param in signature.parameters.items():
-                if param.default == inspect.Parameter.empty and param.kind not in (
-                    inspect.Parameter.VAR_POSITIONAL,
-                    inspect.Parameter.VAR_KEYWORD,
-                ):
-                    mandatory_args.append(name)
-
-            missing_mandatory_args = [
-                arg for arg in mandatory_args if arg not in filtered_args
-            ]
-
-            if missing_mandatory_args:
-                missing_mandatory_args_str = '\n'.join(missing_mandatory_args)
+            missing = self._mandatory_arg_set.difference(filtered_args)
+
+            if missing:
+                # Report in signature order, like FunctionTool
+                missing_mandatory_args_str = '\n'.join(
+                    arg for arg in self._mandatory_args if arg in missing
+                )
                 error_str = f"""Invoking `{self.name}()` failed as the following mandatory input parameters are not present:
 {missing_mandatory_args_str}
 You could retry calling this tool, but it is IMPORTANT for you to provide all the mandatory parameters."""
                 return {'error': error_str}
 
             # Call the function with filtered args
-            if inspect.iscoroutinefunction(self.func):
+            if self._is_coroutine:
                 return await self.func(**filtered_args)
             else:
                 return self.func(**filtered_args)
 
         except Exception as ex:
             # Log the full error for debugging
-            import traceback
-            import logging
-            logger = logging.getLogger(__name__)
             logger.error(f"Tool execution failed: {ex}", exc_info=True)
 
-            # Return detailed error
-            return {
+            result = {
                 "status": "error",
                 "error_type": "execution_error",
                 "message": str(ex),
-                "traceback": traceback.format_exc(),
             }
+            # The traceback is already logged; only ship it to the agent when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                result["traceback"] = traceback.format_exc()
+            return result
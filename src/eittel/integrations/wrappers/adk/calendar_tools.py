@@ -5,7 +5,8 @@ This module provides ADK-compatible Calendar tools with persistent OAuth credent
 No experimental dependencies - production ready.
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Dict, List, Optional, Tuple
 
 from ...gsuite.auth import (
     BASE_SCOPES,
@@ -33,6 +34,8 @@ class PersistentCalendarTool(EittelGoogleTool):
     - No experimental ADK dependencies
     """
 
+    __slots__ = ()
+
     def __init__(self, func, scopes: list[str]):
         """
         Initialize the persistent Calendar tool.
@@ -224,17 +227,37 @@ def create_calendar_tools(include: Optional[List[str]] = None) -> list:
         >>> # Get only create tool
         >>> calendar_tools = create_calendar_tools(include=['create'])
     """
-    # Define required scopes
-    scopes = list(
-        set(
-            BASE_SCOPES
-            + [
-                CALENDAR_SCOPE,
-                CALENDAR_READONLY_SCOPE,
-                CALENDAR_EVENTS_SCOPE,
-            ]
-        )
+    # Tools are stateless per caller (credentials live in shared caches), so
+    # the same instances are handed out for identical requests
+    key = tuple(include) if include is not None else None
+    return list(_build_calendar_tools(key))
+
+
+# Required scopes, computed once at import
+_CALENDAR_TOOL_SCOPES = list(
+    set(
+        BASE_SCOPES
+        + [
+            CALENDAR_SCOPE,
+            CALENDAR_READONLY_SCOPE,
+            CALENDAR_EVENTS_SCOPE,
+        ]
     )
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _build_calendar_tools(include: Optional[Tuple[str, ...]]) -> Tuple[PersistentCalendarTool, ...]:
+    """
+    Build the Calendar tool instances for an include selection (memoized).
+
+    Args:
+        include: Tuple of tool names to include, or None for all tools
+
+    Returns:
+        Tuple of configured Calendar tools
+    """
+    scopes = _CALENDAR_TOOL_SCOPES
 
     # Define all available tools
     all_tools = {
@@ -259,7 +282,7 @@ def create_calendar_tools(include: Optional[List[str]] = None) -> list:
     # Filter tools based on include list
     if include is None:
         # Return all tools
-        return list(all_tools.values())
+        return tuple(all_tools.values())
     else:
         # Return only requested tools
-        return [all_tools[name] for name in include if name in all_tools]
+        return tuple(all_tools[name] for name in include if name in all_tools)
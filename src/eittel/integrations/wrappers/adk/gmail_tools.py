@@ -34,6 +34,8 @@ class PersistentGmailTool(EittelGoogleTool):
     - No experimental ADK dependencies
     """
 
+    __slots__ = ()
+
     def __init__(self, func, scopes: list[str]):
         """
         Initialize the persistent Gmail tool.
@@ -119,6 +121,20 @@ async def send_gmail_message(
 # ==============================================================================
 
 
+# Required scopes, computed once for every tool created
+_GMAIL_TOOL_SCOPES = list(
+    set(
+        BASE_SCOPES
+        + [
+            GMAIL_SEND_SCOPE,
+            GMAIL_READONLY_SCOPE,
+            GMAIL_MODIFY_SCOPE,
+            GMAIL_COMPOSE_SCOPE,
+        ]
+    )
+)
+
+
 def create_gmail_tools(include: Optional[list[str]] = None) -> list:
     """
     Create Gmail tools for ADK with persistent credential storage.
@@ -147,18 +163,7 @@ def create_gmail_tools(include: Optional[list[str]] = None) -> list:
         >>> # Get only send tool
         >>> gmail_tools = create_gmail_tools(include=['send'])
     """
-    # Define required scopes
-    scopes = list(
-        set(
-            BASE_SCOPES
-            + [
-                GMAIL_SEND_SCOPE,
-                GMAIL_READONLY_SCOPE,
-                GMAIL_MODIFY_SCOPE,
-                GMAIL_COMPOSE_SCOPE,
-            ]
-        )
-    )
+    scopes = _GMAIL_TOOL_SCOPES
 
     # Define all available tools
     all_tools = {
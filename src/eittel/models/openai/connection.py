@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 
-import base64
-import json
+import asyncio
 import logging
+from binascii import a2b_base64, b2a_base64
 from typing import AsyncGenerator, Any
+import orjson
 import websockets
 from google.genai import types
 
@@ -17,6 +18,105 @@ from .open_events import (
 
 logger = logging.getLogger('google_adk_community.' + __name__)
 
+# Parsed server events buffered ahead of the consumer of receive()
+RX_QUEUE_MAXSIZE = 256
+
+# Queued by the reader once the websocket closed normally
+_RX_CLOSED = object()
+
+# Activity markers are missing from older google-genai releases
+_ActivityStart = getattr(types, 'ActivityStart', None)
+_ActivityEnd = getattr(types, 'ActivityEnd', None)
+
+# Upper bound on decoded audio merged into one response by receive()
+AUDIO_COALESCE_MAX_BYTES = 32 * 1024
+
+
+# Validated once per role. Responses get shallow copies with their text set,
+# which skips revalidating Content/Part on every delta and keeps each
+# response's content its own (ADK flows may modify it in place, e.g.
+# planners rewriting parts).
+_TEXT_CONTENT_TEMPLATES: dict[str, types.Content] = {
+    role: types.Content(role=role, parts=[types.Part(text='')])
+    for role in ('model', 'user', 'SERVER')
+}
+
+
+def _text_content(role: str, text: str) -> types.Content:
+  """Build a single-text-part Content for a role from its template."""
+  template = _TEXT_CONTENT_TEMPLATES[role]
+  part = template.parts[0].model_copy(update={'text': text})
+  return template.model_copy(update={'parts': [part]})
+
+
+def _server_marker_response(marker: str) -> list[LlmResponse]:
+  """Build the partial SERVER-role response signalling a speech/TTS marker."""
+  return [LlmResponse(content=_text_content('SERVER', marker), partial=True)]
+
+
+def _user_text_item(parts: list[types.Part]) -> dict | None:
+  """Build the user message conversation.item.create event for the text parts.
+
+  Returns None when no part carries text.
+  """
+  texts = [{'type': 'input_text', 'text': t} for p in parts if (t := p.text)]
+  if not texts:
+    return None
+  return {
+      'type': 'conversation.item.create',
+      'item': {
+          'type': 'message',
+          'role': 'user',
+          'content': texts,
+      },
+  }
+
+
+def _dumps(obj: Any) -> str:
+  """Serialize to a JSON text frame (non-string dict keys allowed, as in json)."""
+  return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+_Server = OpenAIEventTypes.Server
+
+# (server event type, handler method name), resolved once at import
+_EVENT_HANDLERS: tuple[tuple[str, str], ...] = (
+    # ===== CONTROL EVENTS =====
+    # Session and response lifecycle management
+    (_Server.CONVERSATION_ITEM_TRUNCATED, '_handle_conversation_truncated'),
+    (_Server.RESPONSE_DONE, '_handle_response_done'),
+    (_Server.ERROR, '_handle_error'),
+
+    # ===== INPUT-RELATED EVENTS =====
+    # Speech detection and transcription
+    (_Server.INPUT_AUDIO_SPEECH_STARTED, '_handle_speech_started'),
+    (_Server.INPUT_AUDIO_SPEECH_STOPPED, '_handle_speech_stopped'),
+    (_Server.INPUT_AUDIO_TIMEOUT_TRIGGERED, '_handle_timeout_triggered'),
+    (_Server.INPUT_TRANSCRIPT_DELTA, '_handle_input_transcript_delta'),
+    (_Server.INPUT_TRANSCRIPT_COMPLETED, '_handle_input_transcript_completed'),
+
+    # ===== OUTPUT-RELATED EVENTS =====
+    # Response generation and streaming
+    (_Server.RESPONSE_OUTPUT_ITEM_ADDED, '_handle_output_item_added'),
+    (_Server.RESPONSE_FUNCTION_ARGS_DELTA, '_handle_function_args_delta'),
+    (_Server.RESPONSE_FUNCTION_ARGS_DONE, '_handle_function_args_done'),
+    (_Server.RESPONSE_OUTPUT_ITEM_DONE, '_handle_output_item_done'),
+
+    # Text output streaming
+    (_Server.RESPONSE_OUTPUT_TEXT_DELTA, '_handle_output_text_delta'),
+    (_Server.RESPONSE_OUTPUT_TEXT_DONE, '_handle_output_text_done'),
+
+    # Audio output streaming
+    (_Server.OUTPUT_AUDIO_STARTED, '_handle_output_audio_started'),
+    (_Server.RESPONSE_OUTPUT_AUDIO_DELTA, '_handle_output_audio_delta'),
+    (_Server.RESPONSE_OUTPUT_AUDIO_DONE, '_handle_output_audio_done'),
+    (_Server.OUTPUT_AUDIO_STOPPED, '_handle_output_audio_stopped'),
+
+    # Audio transcription (output transcription)
+    (_Server.RESPONSE_AUDIO_TRANSCRIPT_DELTA, '_handle_output_transcript_delta'),
+    (_Server.RESPONSE_AUDIO_TRANSCRIPT_DONE, '_handle_output_transcript_done'),
+)
+
 
 class OpenAIRealtimeConnection(BaseLlmConnection):
   """OpenAI Realtime WebSocket connection implementing BaseLlmConnection.
@@ -35,21 +135,33 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       websocket: websockets.asyncio.client.ClientConnection,
       model_name: str,
       tool_param_names: dict[str, set[str]] | None = None,
+      coalesce_audio: bool = True,
   ):
     self._ws = websocket
     self._model_name = model_name
     self._closed = False
     self._tool_param_names = tool_param_names or {}
+    # Merge audio deltas already queued back-to-back into one response;
+    # disable for one response per server chunk
+    self._coalesce_audio = coalesce_audio
     # Track pending function calls where arguments stream via deltas
     self._pending_func_calls: dict[str, dict] = {}
     # Holds final text from response.output_text.done until response.done arrives
+    # Background reader feeding receive(); started on first receive()
+    self._rx_queue: asyncio.Queue | None = None
+    # Event a closed receive() took off the queue but did not handle yet
+    self._rx_pending: dict | object | None = None
+    self._reader: asyncio.Task | None = None
     # Event router
     self._router = OpenAIEventRouter()
     self._register_event_handlers()
 
   async def _send(self, event: dict):
+    await self._send_frame(_dumps(event))
+
+  async def _send_frame(self, frame: str):
     try:
-      await self._ws.send(json.dumps(event))
+      await self._ws.send(frame)
     except Exception as e:
       logger.error('Failed to send event to OpenAI Realtime: %s', e)
       raise
@@ -69,6 +181,10 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
     if not history:
         return
 
+    # Serialize every item first, then write the frames back to back (in
+    # order), so the send loop does no dict building or JSON encoding.
+    payloads: list[str] = []
+
     # Previously tracked whether the last history item was user text to
     # auto-trigger a response. This behavior is removed to avoid automatic
     # responses during history prime.
@@ -89,19 +205,19 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
             for part in content.parts:
                 if part.function_response:
                     try:
-                        output_text = json.dumps(part.function_response.response)
+                        output_text = _dumps(part.function_response.response)
                     except Exception:
                         output_text = str(part.function_response.response)
                     texts.append({'type': 'input_text', 'text': output_text})
             if texts:
-                await self._send({
+                payloads.append(_dumps({
                     'type': 'conversation.item.create',
                     'item': {
                         'type': 'message',
                         'role': 'user',
                         'content': texts,
                     },
-                })
+                }))
             # Do not trigger response.create for tool responses.
             continue
 
@@ -116,30 +232,24 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
                     continue
                 # Sub-case 2b: The model previously sent a text message.
                 if part.text:
-                    await self._send({
+                    payloads.append(_dumps({
                       'type': 'conversation.item.create',
                       'item': {
                           'type': 'message',
                           'role': 'assistant',
                           'content': [{'type': 'text', 'text': part.text}],
                       },
-                    })
+                    }))
 
         # --- Case 3: The content is a standard user text message. ---
         # This runs only if it's not a function_response.
         elif content.role == 'user':
-            texts = [{'type': 'input_text', 'text': p.text} for p in content.parts if p.text]
-            if texts:
-                await self._send({
-                    'type': 'conversation.item.create',
-                    'item': {
-                        'type': 'message',
-                        'role': 'user',
-                        'content': texts,
-                    },
-                })
-            else:
-                pass
+            item = _user_text_item(content.parts)
+            if item is not None:
+                payloads.append(_dumps(item))
+
+    for payload in payloads:
+        await self._send_frame(payload)
 
     # Do not auto-trigger a response after priming conversation history.
 
@@ -152,7 +262,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
         if not part.function_response:
           continue
         call_id = part.function_response.id
-        output = json.dumps(part.function_response.response)
+        output = _dumps(part.function_response.response)
         await self._send({
             'type': 'conversation.item.create',
             'item': {
@@ -166,19 +276,9 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       return
 
     # Plain text
-    texts = []
-    for p in content.parts:
-      if p.text:
-        texts.append({'type': 'input_text', 'text': p.text})
-    if texts:
-      await self._send({
-          'type': 'conversation.item.create',
-          'item': {
-              'type': 'message',
-              'role': 'user',
-              'content': texts,
-          },
-      })
+    item = _user_text_item(content.parts)
+    if item is not None:
+      await self._send(item)
       logger.debug('Trigger response.create after user message')
       await self._send({'type': 'response.create'})
 
@@ -191,46 +291,131 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
     - types.ActivityEnd: map to response.cancel (manual barge/end)
     """
     if isinstance(input, types.Blob):
-      audio_b64 = base64.b64encode(input.data).decode('utf-8')
+      audio_b64 = b2a_base64(input.data, newline=False).decode('ascii')
       await self._send({'type': 'input_audio_buffer.append', 'audio': audio_b64})
       return
     # Map ActivityStart/End to control events for non-VAD workflows
-    if getattr(types, 'ActivityStart', None) and isinstance(input, types.ActivityStart):
+    if _ActivityStart is not None and isinstance(input, _ActivityStart):
       # For client-managed turns (no server VAD), commit appended audio and start response
       await self.commit_input_audio()
       await self.start_response()
       return
-    if getattr(types, 'ActivityEnd', None) and isinstance(input, types.ActivityEnd):
+    if _ActivityEnd is not None and isinstance(input, _ActivityEnd):
       await self.clear_input_audio()
       return
     raise ValueError('Unsupported realtime input type: %s' % type(input))
 
 
   async def receive(self) -> AsyncGenerator[LlmResponse, None]:
-    """Receive server events and yield mapped LlmResponse objects."""
+    """Receive server events and yield mapped LlmResponse objects.
+
+    Frames are read and parsed by a background task into a bounded queue,
+    so the socket keeps being drained while the consumer handles responses.
+    """
+    if self._reader is None:
+      self._rx_queue = asyncio.Queue(maxsize=RX_QUEUE_MAXSIZE)
+      self._reader = asyncio.create_task(self._reader_loop())
+    queue = self._rx_queue
+    dispatch = self._router.dispatch
+    coalesce_audio = self._coalesce_audio
+    audio_delta = _Server.RESPONSE_OUTPUT_AUDIO_DELTA
+    # Event taken off the queue while coalescing audio, handled next
+    pending, self._rx_pending = self._rx_pending, None
+
     try:
-      async for message in self._ws:
-        try:
-          event = json.loads(message)
-        except Exception as e:
-          logger.error('Invalid JSON from OpenAI Realtime: %s', e)
+      while True:
+        if pending is not None:
+          event, pending = pending, None
+        else:
+          event = await queue.get()
+        if event is _RX_CLOSED or isinstance(event, BaseException):
+          # Leave the end marker for any later receive() call
+          queue.put_nowait(event)
+          if event is _RX_CLOSED:
+            return
+          raise event
+
+        if coalesce_audio and event.get('type') == audio_delta:
+          # Only deltas that have already arrived are merged, so no latency
+          # is added; any other event ends the run and is handled after it
+          buf = bytearray()
+          while True:
+            chunk = self._decode_audio_delta(event)
+            if chunk:
+              buf += chunk
+            if len(buf) >= AUDIO_COALESCE_MAX_BYTES or queue.empty():
+              break
+            event = queue.get_nowait()
+            if (
+                event is _RX_CLOSED
+                or isinstance(event, BaseException)
+                or event.get('type') != audio_delta
+            ):
+              pending = event
+              break
+          if buf:
+            yield self._audio_response(bytes(buf))
           continue
 
-        for resp in self._router.dispatch(event):
+        for resp in dispatch(event):
           yield resp
-    except websockets.exceptions.ConnectionClosedOK:
-      return
-    except websockets.exceptions.ConnectionClosed as e:
-      logger.error('OpenAI Realtime connection closed unexpectedly: %s', e)
+    finally:
+      # The consumer may stop (e.g. aclose()) while an event is held back;
+      # keep it for the next receive() instead of losing it
+      self._rx_pending = pending
+
+  async def _reader_loop(self):
+    """Read and parse server frames into the receive queue until close.
+
+    Always ends by queueing an end marker (_RX_CLOSED or the exception),
+    also when cancelled by close(), so receive() never waits forever.
+    """
+    queue = self._rx_queue
+    recv = self._ws.recv
+    end = _RX_CLOSED
+    try:
+      try:
+        while True:
+          # Take frames as bytes: orjson validates UTF-8 itself, so the
+          # websocket layer need not decode text frames to str first
+          message = await recv(decode=False)
+          if not message or message.isspace():
+            continue
+          try:
+            event = orjson.loads(message)
+          except Exception as e:
+            logger.error('Invalid JSON from OpenAI Realtime: %s', e)
+            continue
+          # Blocks when the consumer falls RX_QUEUE_MAXSIZE events behind
+          await queue.put(event)
+      except websockets.exceptions.ConnectionClosedOK:
+        pass
+      except websockets.exceptions.ConnectionClosed as e:
+        logger.error('OpenAI Realtime connection closed unexpectedly: %s', e)
+        end = e
+      except Exception as e:
+        end = e
+      await queue.put(end)
+    except asyncio.CancelledError:
+      if queue.full():
+        # The connection is closing with the consumer RX_QUEUE_MAXSIZE
+        # events behind: drop one so the end marker still fits
+        queue.get_nowait()
+      queue.put_nowait(end)
       raise
 
   async def close(self):
     if self._closed:
       return
     try:
+      # Closing the socket ends the reader's recv() with ConnectionClosedOK
       await self._ws.close()
     finally:
       self._closed = True
+      # Stops a reader blocked on a full queue; it still queues the end
+      # marker, so a pending receive() returns
+      if self._reader is not None:
+        self._reader.cancel()
 
   # ----------------------
   # Client control helpers
@@ -261,47 +446,16 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
   # ----------------------
 
   def _register_event_handlers(self):
-    # Map server event types to instance methods
-
-    # ===== CONTROL EVENTS =====
-    # Session and response lifecycle management
-    self._router.register(OpenAIEventTypes.Server.CONVERSATION_ITEM_TRUNCATED, lambda e, raw: self._handle_conversation_truncated())
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_DONE, lambda e, raw: self._handle_response_done(raw))
-    self._router.register(OpenAIEventTypes.Server.ERROR, lambda e, raw: self._handle_error(raw))
-
-    # ===== INPUT-RELATED EVENTS =====
-    # Speech detection and transcription
-    self._router.register(OpenAIEventTypes.Server.INPUT_AUDIO_SPEECH_STARTED, lambda e, raw: self._handle_speech_started())
-    self._router.register(OpenAIEventTypes.Server.INPUT_AUDIO_SPEECH_STOPPED, lambda e, raw: self._handle_speech_stopped())
-    self._router.register(OpenAIEventTypes.Server.INPUT_AUDIO_TIMEOUT_TRIGGERED, lambda e, raw: self._handle_timeout_triggered())
-    self._router.register(OpenAIEventTypes.Server.INPUT_TRANSCRIPT_DELTA, lambda e, raw: self._handle_input_transcript_delta(raw))
-    self._router.register(OpenAIEventTypes.Server.INPUT_TRANSCRIPT_COMPLETED, lambda e, raw: self._handle_input_transcript_completed(raw))
-
-    # ===== OUTPUT-RELATED EVENTS =====
-    # Response generation and streaming
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_ITEM_ADDED, lambda e, raw: self._handle_output_item_added(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_FUNCTION_ARGS_DELTA, lambda e, raw: self._handle_function_args_delta(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_FUNCTION_ARGS_DONE, lambda e, raw: self._handle_function_args_done(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_ITEM_DONE, lambda e, raw: self._handle_output_item_done(raw))
-
-    # Text output streaming
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_TEXT_DELTA, lambda e, raw: self._handle_output_text_delta(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_TEXT_DONE, lambda e, raw: self._handle_output_text_done(raw))
-
-    # Audio output streaming
-    self._router.register(OpenAIEventTypes.Server.OUTPUT_AUDIO_STARTED, lambda e, raw: self._handle_output_audio_started())
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_AUDIO_DELTA, lambda e, raw: self._handle_output_audio_delta(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_OUTPUT_AUDIO_DONE, lambda e, raw: self._handle_output_audio_done(raw))
-    self._router.register(OpenAIEventTypes.Server.OUTPUT_AUDIO_STOPPED, lambda e, raw: self._handle_output_audio_stopped())
-
-    # Audio transcription (output transcription)
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_AUDIO_TRANSCRIPT_DELTA, lambda e, raw: self._handle_output_transcript_delta(raw))
-    self._router.register(OpenAIEventTypes.Server.RESPONSE_AUDIO_TRANSCRIPT_DONE, lambda e, raw: self._handle_output_transcript_done(raw))
+    # Map server event types to instance methods. Handlers are bound methods
+    # taking the raw event dict, so dispatch needs no typed event or wrapper.
+    register = self._router.register
+    for event_type, handler_name in _EVENT_HANDLERS:
+      register(event_type, getattr(self, handler_name), typed=False)
 
   # ===== CONTROL EVENT HANDLERS =====
   # Session and response lifecycle management
 
-  def _handle_conversation_truncated(self) -> list[LlmResponse]:
+  def _handle_conversation_truncated(self, event: dict | None = None) -> list[LlmResponse]:
     return [LlmResponse(interrupted=True, partial=True)]
 
   def _handle_response_done(
@@ -326,35 +480,14 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
   # ===== INPUT EVENT HANDLERS =====
   # Speech detection and transcription
 
-  def _handle_speech_started(self) -> list[LlmResponse]:
-    return [
-        LlmResponse(
-            content=types.Content(
-                role='SERVER', parts=[types.Part.from_text(text='SPEECH_START')]
-            ),
-            partial=True,
-        )
-    ]
+  def _handle_speech_started(self, event: dict | None = None) -> list[LlmResponse]:
+    return _server_marker_response('SPEECH_START')
 
-  def _handle_speech_stopped(self) -> list[LlmResponse]:
-    return [
-        LlmResponse(
-            content=types.Content(
-                role='SERVER', parts=[types.Part.from_text(text='SPEECH_END')]
-            ),
-            partial=True,
-        )
-    ]
+  def _handle_speech_stopped(self, event: dict | None = None) -> list[LlmResponse]:
+    return _server_marker_response('SPEECH_END')
 
-  def _handle_timeout_triggered(self) -> list[LlmResponse]:
-    return [
-        LlmResponse(
-            content=types.Content(
-                role='SERVER', parts=[types.Part.from_text(text='TIMEOUT')]
-            ),
-            partial=True,
-        )
-    ]
+  def _handle_timeout_triggered(self, event: dict | None = None) -> list[LlmResponse]:
+    return _server_marker_response('TIMEOUT')
 
   def _handle_input_transcript_delta(self, event: dict) -> list[LlmResponse]:
     delta = event.get('delta', '')
@@ -362,9 +495,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       return []
     return [
         LlmResponse(
-            content=types.Content(
-                role='user', parts=[types.Part.from_text(text=delta)]
-            ),
+            content=_text_content('user', delta),
             partial=True,
         )
     ]
@@ -377,9 +508,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       return []
     return [
         LlmResponse(
-            content=types.Content(
-                role='user', parts=[types.Part.from_text(text=transcript)]
-            )
+            content=_text_content('user', transcript)
         )
     ]
 
@@ -391,17 +520,12 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
     if item.get('type') != 'function_call':
       return []
     name = item.get('name') or ''
-    args_str = item.get('arguments') or '{}'
-    try:
-      args = json.loads(args_str)
-    except Exception:
-      args = {}
+    args_str = item.get('arguments')
     item_id = item.get('id') or item.get('call_id') or ''
     self._pending_func_calls[item_id] = {
         'name': name,
-        'args_buffer': (
-            args_str if isinstance(args_str, str) else json.dumps(args)
-        ),
+        # Argument fragments, joined once when the call is done
+        'args_buffer': [args_str] if args_str and isinstance(args_str, str) else [],
     }
     # Defer emission until done
     return []
@@ -409,15 +533,15 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
   def _handle_function_args_delta(self, event: dict) -> list[LlmResponse]:
     delta = event.get('delta', '')
     item_id = event.get('item_id') or event.get('id') or ''
-    if item_id in self._pending_func_calls:
-      self._pending_func_calls[item_id]['args_buffer'] += delta
+    if delta and item_id in self._pending_func_calls:
+      self._pending_func_calls[item_id]['args_buffer'].append(delta)
     return []
 
   def _handle_function_args_done(self, event: dict) -> list[LlmResponse]:
     item_id = event.get('item_id') or event.get('id') or ''
     args_str = event.get('arguments', '')
     if item_id in self._pending_func_calls and isinstance(args_str, str):
-      self._pending_func_calls[item_id]['args_buffer'] = args_str
+      self._pending_func_calls[item_id]['args_buffer'] = [args_str]
     return []
 
   def _handle_output_item_done(self, event: dict) -> list[LlmResponse]:
@@ -429,7 +553,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
     if not pending:
       return []
     try:
-      args = json.loads(pending['args_buffer'] or '{}')
+      args = orjson.loads(''.join(pending['args_buffer']) or '{}')
     except Exception:
       args = {}
     func_call = types.FunctionCall(name=pending['name'], args=args)
@@ -447,39 +571,37 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
     delta = event.get('delta', '')
     if not delta:
       return []
-    content = types.Content(
-        role='model', parts=[types.Part.from_text(text=delta)]
-    )
+    content = _text_content('model', delta)
     return [LlmResponse(content=content, partial=True)]
 
   def _handle_output_text_done(self, event: dict) -> list[LlmResponse]:
     text = event.get('text', '')
     if text:
-      content = types.Content(
-          role='model', parts=[types.Part.from_text(text=text)]
-      )
+      content = _text_content('model', text)
       return [(LlmResponse(content=content))]
 
   # Audio output streaming
-  def _handle_output_audio_started(self) -> list[LlmResponse]:
-    return [
-        LlmResponse(
-            content=types.Content(
-                role='SERVER', parts=[types.Part.from_text(text='TTS_START')]
-            ),
-            partial=True,
-        )
-    ]
+  def _handle_output_audio_started(self, event: dict | None = None) -> list[LlmResponse]:
+    return _server_marker_response('TTS_START')
 
   def _handle_output_audio_delta(self, event: dict) -> list[LlmResponse]:
+    audio_bytes = self._decode_audio_delta(event)
+    if not audio_bytes:
+      return []
+    return [self._audio_response(audio_bytes)]
+
+  def _decode_audio_delta(self, event: dict) -> bytes | None:
+    """Decode the base64 PCM payload of an audio delta event."""
     delta = event.get('delta', '')
     if not delta:
-      return []
+      return None
     try:
-      audio_bytes = base64.b64decode(delta)
+      return a2b_base64(delta)
     except Exception:
       logger.warning('Invalid audio delta payload from OpenAI Realtime')
-      return []
+      return None
+
+  def _audio_response(self, audio_bytes: bytes) -> LlmResponse:
     content = types.Content(
         role='model',
         parts=[
@@ -491,18 +613,15 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
             )
         ],
     )
-    return [LlmResponse(content=content, partial=True)]
+    return LlmResponse(content=content, partial=True)
 
 
-  def _handle_output_audio_stopped(self) -> list[LlmResponse]:
-    return [
-        LlmResponse(
-            content=types.Content(
-                role='SERVER', parts=[types.Part.from_text(text='TTS_END')]
-            ),
-            partial=True,
-        )
-    ]
+  def _handle_output_audio_done(self, event: dict) -> list[LlmResponse]:
+    # Audio was already streamed as deltas; TTS_END follows on buffer stop
+    return []
+
+  def _handle_output_audio_stopped(self, event: dict | None = None) -> list[LlmResponse]:
+    return _server_marker_response('TTS_END')
 
   # Audio transcription (output transcription)
   def _handle_output_transcript_delta(self, event: dict) -> list[LlmResponse]:
@@ -511,9 +630,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       return []
     return [
         LlmResponse(
-            content=types.Content(
-                role='model', parts=[types.Part.from_text(text=delta)]
-            ),
+            content=_text_content('model', delta),
             partial=True,
         )
     ]
@@ -525,9 +642,7 @@ class OpenAIRealtimeConnection(BaseLlmConnection):
       return []
     return [
         LlmResponse(
-            content=types.Content(
-                role='model', parts=[types.Part.from_text(text=transcript)]
-            )
+            content=_text_content('model', transcript)
         )
     ]
 
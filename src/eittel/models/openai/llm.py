@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import os
 import json
 import logging
@@ -8,6 +9,7 @@ from typing import AsyncGenerator
 from typing import TYPE_CHECKING
 
 from google.genai import types
+import orjson
 import websockets
 
 from google.adk.models.base_llm import BaseLlm
@@ -24,10 +26,61 @@ from .. import (
 
 logger = logging.getLogger('google_adk_community.' + __name__)
 
+_BASE_HEADERS = {'OpenAI-Beta': 'realtime=v1'}
+
+
+@functools.lru_cache(maxsize=1)
+def _auth_headers(api_key: str | None) -> dict[str, str]:
+  """Base connect headers for an API key; shared, so never mutate the result.
+
+  Keyed on the key value, so a changed OPENAI_API_KEY is still picked up.
+  """
+  if not api_key:
+    return _BASE_HEADERS
+  return {**_BASE_HEADERS, 'Authorization': f'Bearer {api_key}'}
+
+
+class _LazyJson:
+  """Log argument that serializes its value only if the record is emitted."""
+
+  __slots__ = ('_value',)
+
+  def __init__(self, value):
+    self._value = value
+
+  def __str__(self) -> str:
+    try:
+      return json.dumps(self._value, ensure_ascii=False)
+    except Exception:
+      return f'(raw) {self._value!r}'
+
 if TYPE_CHECKING:
   from google.adk.models.llm_request import LlmRequest
 
 
+def _deep_merge(base: dict, extra: dict) -> dict:
+  """Merge extra into base without dropping nested keys.
+
+  Skips None values so they don't delete existing settings. Nested dicts
+  of base are copied before being merged into, so dicts shared with the
+  caller's overrides are never modified. Iterative, one level per step.
+  """
+  stack = [(base, extra)]
+  while stack:
+    target, source = stack.pop()
+    for k, v in (source or {}).items():
+      if v is None:
+        continue
+      current = target.get(k)
+      if isinstance(v, dict) and isinstance(current, dict):
+        merged = dict(current)
+        target[k] = merged
+        stack.append((merged, v))
+      else:
+        target[k] = v
+  return base
+
+
 class OpenAIRealtime(BaseLlm):
   """Community provider for OpenAI Realtime models (WebSocket)."""
 
@@ -49,17 +102,17 @@ class OpenAIRealtime(BaseLlm):
   async def connect(
       self, llm_request: 'LlmRequest'
   ) -> AsyncGenerator[BaseLlmConnection, None]:
-    api_key = os.getenv('OPENAI_API_KEY')
-    headers = {'OpenAI-Beta': 'realtime=v1'}
-    if api_key:
-      headers['Authorization'] = f'Bearer {api_key}'
+    headers = _auth_headers(os.getenv('OPENAI_API_KEY'))
 
     if (
         llm_request.live_connect_config
         and llm_request.live_connect_config.http_options
         and llm_request.live_connect_config.http_options.headers
     ):
-      headers.update(llm_request.live_connect_config.http_options.headers)
+      headers = {
+          **headers,
+          **llm_request.live_connect_config.http_options.headers,
+      }
 
     model_name = llm_request.model or self.model
     url = f'wss://api.openai.com/v1/realtime?model={model_name}'
@@ -79,20 +132,6 @@ class OpenAIRealtime(BaseLlm):
 
     # Build overrides from registered provider and runtime context
     try:
-      def _deep_merge(base: dict, extra: dict) -> dict:
-        """Recursively merge extra into base without dropping nested keys.
-
-        Skips None values so they don't delete existing settings.
-        """
-        for k, v in (extra or {}).items():
-          if v is None:
-            continue
-          if isinstance(v, dict) and isinstance(base.get(k), dict):
-            base[k] = _deep_merge(dict(base[k]), v)
-          else:
-            base[k] = v
-        return base
-
       overrides = {}
       # Merge provider overrides if a provider has been registered
       prov = get_realtime_runconfig_provider()
@@ -100,26 +139,20 @@ class OpenAIRealtime(BaseLlm):
         try:
           provider_overrides = prov(llm_request)  # type: ignore[arg-type]
           if isinstance(provider_overrides, dict):
-            try:
-              logger.info(
-                "OpenAI Realtime provider overrides: %s",
-                json.dumps(provider_overrides, ensure_ascii=False),
-              )
-            except Exception:
-              logger.info("OpenAI Realtime provider overrides (raw): %s", provider_overrides)
+            logger.info(
+              "OpenAI Realtime provider overrides: %s",
+              _LazyJson(provider_overrides),
+            )
             overrides = _deep_merge(overrides, provider_overrides)
         except Exception:
           pass
       # Merge ephemeral runtime context if set by the app
       runtime_ctx = get_realtime_context()
       if isinstance(runtime_ctx, dict):
-        try:
-          logger.info(
-            "OpenAI Realtime runtime context: %s",
-            json.dumps(runtime_ctx, ensure_ascii=False),
-          )
-        except Exception:
-          logger.info("OpenAI Realtime runtime context (raw): %s", runtime_ctx)
+        logger.info(
+          "OpenAI Realtime runtime context: %s",
+          _LazyJson(runtime_ctx),
+        )
         overrides = _deep_merge(overrides, runtime_ctx)
       if overrides:
         session_update['session'] = _deep_merge(
@@ -142,26 +175,15 @@ class OpenAIRealtime(BaseLlm):
       if tools:
         session_update['session']['tools'] = tools
 
-    # Log the session.update intent and, in debug, the full session config
-    try:
-      logger.info("OpenAI Realtime session.update (initial settings)")
-      # Always log the session settings at INFO for troubleshooting
-      try:
-        logger.info(
-          "OpenAI Realtime session settings: %s",
-          json.dumps(session_update.get('session', {}), ensure_ascii=False),
-        )
-      except Exception:
-        # Fallback to debug if serialization fails
-        if logger.isEnabledFor(logging.DEBUG):
-          logger.debug(
-            "OpenAI Realtime session settings (raw): %s",
-            session_update.get('session', {}),
-          )
-    except Exception:
-      pass
+    # Serialize once: the same text is logged and sent
+    payload = orjson.dumps(session_update, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # Log the session.update intent and the full session config
+    logger.info("OpenAI Realtime session.update (initial settings)")
+    # Always log the session settings at INFO for troubleshooting
+    logger.info("OpenAI Realtime session settings: %s", payload)
 
-    await ws.send(json.dumps(session_update, separators=(",", ":"), ensure_ascii=False))
+    await ws.send(payload)
 
     try:
       yield OpenAIRealtimeConnection(websocket=ws, model_name=model_name)
@@ -172,6 +194,5 @@ class OpenAIRealtime(BaseLlm):
         pass
 
 
-# Register on import
-for regex in OpenAIRealtime.supported_models():
-  LLMRegistry.register(OpenAIRealtime)
+# Register on import; register() adds every supported_models() regex
+LLMRegistry.register(OpenAIRealtime)
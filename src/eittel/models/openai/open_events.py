@@ -280,22 +280,28 @@ def parse_server_event(event: dict[str, Any]) -> ServerEvent:
 class OpenAIEventRouter:
   """Simple router that maps event.type to registered handler callables.
 
-  Handlers receive the typed Pydantic event and the original payload.
+  Handlers receive the typed Pydantic event and the original payload, or
+  only the payload when registered with ``typed=False`` (no model is built).
   """
 
   def __init__(self):
-    self._handlers: dict[str, Callable[[ServerEvent, dict[str, Any]], list[Any]]] = {}
+    self._handlers: dict[str, tuple[Callable[..., list[Any]], bool]] = {}
 
-  def register(self, event_type: str, handler: Callable[[ServerEvent, dict[str, Any]], list[Any]]):
-    self._handlers[event_type] = handler
+  def register(
+      self,
+      event_type: str,
+      handler: Callable[..., list[Any]],
+      typed: bool = True,
+  ):
+    self._handlers[event_type] = (handler, typed)
 
   def dispatch(self, event: dict[str, Any]) -> list[Any]:
     if not isinstance(event, dict):
       return []
-    typed = parse_server_event(event)
-    handler = self._handlers.get(typed.type)
-    if handler is None:
+    entry = self._handlers.get(event.get('type'))
+    if entry is None:
       return []
-    return handler(typed, event)
-
-
+    handler, typed = entry
+    if typed:
+      return handler(parse_server_event(event), event)
+    return handler(event)
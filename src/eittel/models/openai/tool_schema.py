@@ -85,11 +85,14 @@ def function_tools_to_openai_session_tools(
     if not tool.function_declarations:
       continue
     for decl in tool.function_declarations:
-      params_schema = (
-          adk_schema_to_openai_json_schema(decl.parameters)
-          if decl.parameters
-          else {'type': 'object'}
-      )
+      # Declarations built with a JSON schema (ADK's JSON_SCHEMA_FOR_FUNC_DECL
+      # feature) already carry what OpenAI expects: use it as is.
+      if decl.parameters_json_schema:
+        params_schema = decl.parameters_json_schema
+      elif decl.parameters:
+        params_schema = adk_schema_to_openai_json_schema(decl.parameters)
+      else:
+        params_schema = {'type': 'object'}
       converted.append({
           'type': 'function',
           'name': decl.name,
@@ -22,6 +22,7 @@ from .oauth_manager import (
 )
 from .firebase_auth import verify_firebase_token
 from .state_storage import OAuthStateStorage
+from ..integrations.gsuite.auth.firestore_credential_store import get_shared_firestore_client
 
 logger = logging.getLogger(__name__)
 
@@ -81,10 +82,7 @@ def get_firestore_client() -> firestore.Client:
     if not FIRESTORE_PROJECT:
         raise ValueError("FIRESTORE_PROJECT environment variable not set")
 
-    return firestore.Client(
-        project=FIRESTORE_PROJECT,
-        database=FIRESTORE_DATABASE,
-    )
+    return get_shared_firestore_client(FIRESTORE_PROJECT, FIRESTORE_DATABASE)
 
 
 def get_token_storage(db: firestore.Client = Depends(get_firestore_client)) -> FirestoreTokenStorage:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import os
 from typing import Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
@@ -13,6 +13,8 @@ from googleapiclient.discovery import build
 from google.auth.transport.requests import Request
 import logging
 
+from ..integrations.gsuite.auth import get_credential_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -122,12 +124,17 @@ class GoogleOAuthManager:
         Returns:
             Google Credentials object
         """
-        expiry = None
-        if token_data.get("expiry"):
+        expiry = token_data.get("expiry")
+        if isinstance(expiry, str):
             try:
-                expiry = datetime.fromisoformat(token_data["expiry"])
-            except (ValueError, TypeError):
-                pass
+                expiry = datetime.fromisoformat(expiry)
+            except ValueError:
+                expiry = None
+        if not isinstance(expiry, datetime):
+            expiry = None
+        elif expiry.tzinfo is not None:
+            # Firestore Timestamps come back timezone-aware; google-auth expects naive UTC
+            expiry = expiry.astimezone(timezone.utc).replace(tzinfo=None)
         
         return Credentials(
             token=token_data.get("token"),
@@ -220,6 +227,8 @@ class FirestoreTokenStorage:
             },
             merge=True,
         )
+        # Let tools see the new tokens immediately if this user was negative-cached
+        get_credential_cache().clear_missing(user_id)
         logger.info(f"Stored OAuth tokens for user {user_id} in {self.collection_name}/{user_id}/{self.token_field}")
 
     def get_tokens(self, user_id: str) -> Optional[dict[str, Any]]:
@@ -0,0 +1,114 @@
+import asyncio
+import base64
+import unittest
+
+import websockets
+
+from eittel.models.openai.connection import OpenAIRealtimeConnection
+
+
+class _HangingWebSocket:
+  """Websocket whose recv() never returns, even after close()."""
+
+  def __init__(self):
+    self.closed = False
+
+  async def recv(self, decode=None):
+    await asyncio.Event().wait()
+
+  async def send(self, message):
+    pass
+
+  async def close(self):
+    self.closed = True
+
+
+class _ClosingWebSocket(_HangingWebSocket):
+  """Websocket whose recv() ends with ConnectionClosedOK once closed."""
+
+  def __init__(self):
+    super().__init__()
+    self._closed_event = asyncio.Event()
+
+  async def recv(self, decode=None):
+    await self._closed_event.wait()
+    raise websockets.exceptions.ConnectionClosedOK(None, None)
+
+  async def close(self):
+    await super().close()
+    self._closed_event.set()
+
+
+class _ScriptedWebSocket(_ClosingWebSocket):
+  """Websocket that returns the given frames, then waits to be closed."""
+
+  def __init__(self, frames):
+    super().__init__()
+    self._frames = list(frames)
+
+  async def recv(self, decode=None):
+    if self._frames:
+      return self._frames.pop(0)
+    return await super().recv(decode)
+
+
+def _audio_delta(data):
+  return (
+      b'{"type":"response.audio.delta","delta":"'
+      + base64.b64encode(data)
+      + b'"}'
+  )
+
+
+class ReceiveCloseTest(unittest.IsolatedAsyncioTestCase):
+
+  async def _drain_then_close(self, ws):
+    conn = OpenAIRealtimeConnection(websocket=ws, model_name='gpt-realtime')
+
+    async def consume():
+      return [resp async for resp in conn.receive()]
+
+    consumer = asyncio.create_task(consume())
+    # Let receive() start the reader and block on the empty queue
+    await asyncio.sleep(0.01)
+    await conn.close()
+
+    responses = await asyncio.wait_for(consumer, timeout=2)
+    self.assertEqual(responses, [])
+    self.assertTrue(ws.closed)
+
+  async def test_close_ends_receive_when_recv_hangs(self):
+    await self._drain_then_close(_HangingWebSocket())
+
+  async def test_close_ends_receive_when_socket_closes(self):
+    await self._drain_then_close(_ClosingWebSocket())
+
+
+class ReceivePendingEventTest(unittest.IsolatedAsyncioTestCase):
+
+  async def test_event_held_while_coalescing_survives_aclose(self):
+    ws = _ScriptedWebSocket([
+        _audio_delta(b'ab'),
+        _audio_delta(b'cd'),
+        b'{"type":"response.done","response":{}}',
+    ])
+    conn = OpenAIRealtimeConnection(websocket=ws, model_name='gpt-realtime')
+    # Start the reader and let it queue every frame before consuming
+    receiver = conn.receive()
+    first = asyncio.ensure_future(anext(receiver))
+    await asyncio.sleep(0.01)
+
+    audio = await first
+    self.assertEqual(audio.content.parts[0].inline_data.data, b'abcd')
+    # Stop consuming while response.done is held back by the coalescer
+    await receiver.aclose()
+
+    receiver = conn.receive()
+    done = await asyncio.wait_for(anext(receiver), timeout=2)
+    self.assertTrue(done.turn_complete)
+    await receiver.aclose()
+    await conn.close()
+
+
+if __name__ == '__main__':
+  unittest.main()